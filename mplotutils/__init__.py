@@ -1,32 +1,47 @@
 # flake8: noqa
 
+from importlib import import_module as _import_module
 from importlib.metadata import version as _get_version
 
-from mplotutils import _cartopy_utils, _colorbar, _colormaps
-from mplotutils._cartopy_utils import (
-    cyclic_dataarray,
-    sample_data_map,
-    sample_dataarray,
-    xlabel_map,
-    xticklabels,
-    ylabel_map,
-    yticklabels,
-)
-from mplotutils._colorbar import colorbar
+from mplotutils import _colorbar, _colormaps
+from mplotutils._blit import BlitManager
+from mplotutils._colorbar import batch_layout, colorbar
 from mplotutils._colormaps import from_levels_and_cmap
 from mplotutils._deprecate import _module_renamed_warning_init
-from mplotutils._hatch import hatch, hatch_map, hatch_map_global
-from mplotutils._map_layout import set_map_layout
 from mplotutils._mpl import _get_renderer
+from mplotutils._options import set_options
+from mplotutils._render import render_many
 from mplotutils._savefig import autodraw
+from mplotutils._template import FigureTemplate
 from mplotutils._xrcompat import infer_interval_breaks
 
+# modules importing cartopy, shapely, xarray, or mpl_toolkits are only loaded on first
+# attribute access to keep ``import mplotutils`` lightweight
+_LAZY_MODULES = ("_cartopy_utils", "_hatch", "_map_layout")
+
+_LAZY_FUNCTIONS = {
+    "cyclic_dataarray": "_cartopy_utils",
+    "sample_data_map": "_cartopy_utils",
+    "sample_dataarray": "_cartopy_utils",
+    "xlabel_map": "_cartopy_utils",
+    "xticklabels": "_cartopy_utils",
+    "ylabel_map": "_cartopy_utils",
+    "yticklabels": "_cartopy_utils",
+    "hatch": "_hatch",
+    "hatch_map": "_hatch",
+    "hatch_map_global": "_hatch",
+    "set_map_layout": "_map_layout",
+}
+
 autodraw(True)
 
 __all__ = [
+    "BlitManager",
+    "FigureTemplate",
     "_colorbar",
     "_get_renderer",
     "autodraw",
+    "batch_layout",
     "_cartopy_utils",
     "colorbar",
     "_colormaps",
@@ -36,9 +51,11 @@ __all__ = [
     "hatch_map",
     "hatch",
     "infer_interval_breaks",
+    "render_many",
     "sample_data_map",
     "sample_dataarray",
     "set_map_layout",
+    "set_options",
     "xlabel_map",
     "xticklabels",
     "ylabel_map",
@@ -56,6 +73,16 @@ except Exception:
 
 def __getattr__(attr):
 
+    if attr in _LAZY_MODULES:
+        return _import_module(f".{attr}", "mplotutils")
+
+    if attr in _LAZY_FUNCTIONS:
+        module = _import_module(f".{_LAZY_FUNCTIONS[attr]}", "mplotutils")
+        obj = getattr(module, attr)
+        # cache the object so __getattr__ is only called once per attribute
+        globals()[attr] = obj
+        return obj
+
     m = (
         "cartopy_utils",
         "colormaps",
@@ -78,3 +105,7 @@ def __getattr__(attr):
 
     # required for ipython tab completion
     raise AttributeError(f"module {__name__!r} has no attribute {attr!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES) | set(_LAZY_FUNCTIONS))
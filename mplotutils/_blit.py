@@ -0,0 +1,125 @@
+class BlitManager:
+    """cache the static parts of a figure and only redraw the dynamic artists
+
+    The static layer (e.g. coastlines, gridlines, tick labels, and colorbars) is
+    rendered once and cached as background. On ``update`` only the dynamic artists
+    (e.g. the mesh and the hatches) are drawn on top of the cached background. The
+    background is re-rendered if the figure size or dpi changes. Requires a backend
+    supporting blitting (e.g. Agg or an interactive backend based on it).
+
+    ``update`` draws the dynamic artists over the whole static layer, i.e., they cover
+    static artists with a higher zorder (e.g. coastlines drawn on top of the mesh).
+    Regular draws of the figure (e.g. ``fig.savefig``) draw all artists in the order
+    of their zorder.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to manage.
+    artists : iterable of Artist
+        Dynamic artists which change between frames. They are only excluded from the
+        cached background and are drawn normally otherwise.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> import mplotutils as mpu
+
+    >>> f, ax = plt.subplots()
+    >>> h = ax.pcolormesh([[0, 1], [2, 3]], vmin=0, vmax=3)
+    >>> bm = mpu.BlitManager(f, [h])
+    >>> for i in range(3):
+    ...     h.set_array([[i, 1], [2, 3]])
+    ...     bm.update()
+
+    Notes
+    -----
+    Adapted from https://matplotlib.org/stable/users/explain/animations/blitting.html
+    """
+
+    def __init__(self, fig, artists):
+
+        self.fig = fig
+        self._background = None
+        self._key = None
+        self._caching = False
+        self.artists = []
+
+        for artist in artists:
+            self.add_artist(artist)
+
+        self.cid = fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def add_artist(self, artist):
+        """add a dynamic artist"""
+
+        if artist.figure is not self.fig:
+            raise ValueError("The artist must belong to the figure of the BlitManager")
+
+        self.artists.append(artist)
+
+    def remove_artist(self, artist):
+        """remove a dynamic artist - it becomes part of the static layer"""
+
+        self.artists.remove(artist)
+        self._background = None
+
+    def update(self):
+        """draw the dynamic artists on top of the cached background"""
+
+        canvas = self.fig.canvas
+
+        if self._background is None or self._key != self._get_key():
+            self._cache_background()
+        else:
+            canvas.restore_region(self._background)
+
+        self._prune_artists()
+        for artist in self.artists:
+            self.fig.draw_artist(artist)
+
+        canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+
+    def remove(self):
+        """disconnect the draw_event callback and forget the dynamic artists"""
+
+        self.fig.canvas.mpl_disconnect(self.cid)
+
+        self.artists = []
+        self._background = None
+
+    def _get_key(self):
+        return tuple(self.fig.get_size_inches()), self.fig.dpi
+
+    def _cache_background(self):
+
+        # the artists are only animated while caching, so regular draws (e.g. of
+        # interactive backends or savefig) keep their zorder
+        self._prune_artists()
+        for artist in self.artists:
+            artist.set_animated(True)
+
+        # draws the figure without the animated artists
+        self._caching = True
+        try:
+            self.fig.canvas.draw()
+        finally:
+            self._caching = False
+            for artist in self.artists:
+                artist.set_animated(False)
+
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._key = self._get_key()
+
+    def _prune_artists(self):
+        # forget artists that were removed from the figure
+        self.artists = [a for a in self.artists if a.figure is self.fig]
+
+    def _on_draw(self, event):
+
+        if self._caching:
+            return
+
+        # the static layer may have changed (e.g. zoom) - re-cache on next update
+        self._background = None
@@ -1,8 +1,13 @@
+import functools
 import warnings
 
 import cartopy.crs as ccrs
+import matplotlib.artist as martist
 import matplotlib.pyplot as plt
+import matplotlib.text as mtext
+import matplotlib.transforms as mtransforms
 import numpy as np
+import shapely
 import shapely.geometry
 from cartopy.mpl.gridliner import LATITUDE_FORMATTER, LONGITUDE_FORMATTER
 
@@ -92,6 +97,13 @@ def cyclic_dataarray(obj, coord="lon"):
     obj_cyclic : xr.Dataset | xr.DataArray
         The same as `obj` with a cyclic data point added.
 
+    Notes
+    -----
+    For numpy-backed data the result is a new array, i.e., the peak memory is the
+    size of `obj` plus the size of the result. Dask-backed data is not computed and
+    keeps its chunks. To plot a single time step of a large array, select it first,
+    i.e., ``cyclic_dataarray(obj.isel(time=0))`` or use dask.
+
     Examples
     --------
     >>> import xarray as xr
@@ -114,18 +126,21 @@ def cyclic_dataarray(obj, coord="lon"):
     if coord not in obj.coords:
         raise KeyError(f"Did not find '{coord}' in obj")
 
-    obj = obj.pad({coord: (0, 1)}, mode="wrap")
-
-    # extrapolate the coords
-    diff = obj[coord].isel({coord: slice(None, -1)}).diff(coord)
+    # check the coords before padding the data
+    diff = obj[coord].diff(coord)
 
     if not np.allclose(diff, diff[0]):
         raise ValueError(f"The coordinate '{coord}' must be equally spaced")
 
+    # copies numpy-backed data once - dask-backed data stays lazy and only a
+    # one-column chunk taken from the first chunk along coord is added
+    obj = obj.pad({coord: (0, 1)}, mode="wrap")
+
     # the data is not writable (pandas 3) - a copy is required
     lon = obj[coord].variable
-
     arr = np.array(lon.data)
+
+    # extrapolate the coords
     arr[-1] = arr[-2] + diff[0]
 
     lon = type(lon)(lon.dims, arr, attrs=lon.attrs, encoding=lon.encoding)
@@ -272,6 +287,9 @@ def yticklabels(
     ha="right",
     va="center",
     bbox_props=dict(ec="none", fc="none"),
+    collection=False,
+    outer_only=False,
+    dynamic=False,
     **kwargs,
 ):
     """draw yticklabels on map plots - may or may not work
@@ -289,7 +307,7 @@ def yticklabels(
     weight : string, optional
         Fontweight, defaults to mpl.rcParams['axes.labelweight'], usually
         'normal'.
-    ax : GeoAxes, optional
+    ax : GeoAxes | iterable of GeoAxes, optional
         Axes to add the labels to. Default plt.gca(.
     ha : string
         Horizontal alignment, default: 'right'.
@@ -297,19 +315,51 @@ def yticklabels(
         Vertical alignment, default: 'center'.
     bbox_props : dict
         Properties of the bounding box. Default: dict(ec='none', fc='none')
+    collection : bool, default: False
+        If True, all labels are drawn by a single ``MapTickLabels`` artist instead
+        of one annotation per label, which is faster to draw.
+    outer_only : bool, default: False
+        If True and ``ax`` is a grid of subplots, only label the axes in the
+        left column.
+    dynamic : bool, default: False
+        If True, the labels are drawn by a ``DynamicMapTickLabels`` artist, which
+        recomputes their positions when the extent of the map changes (e.g. after
+        ``set_extent`` or zooming). Implies ``collection=True``.
     **kwargs : additional arguments
-        Passed to ax.annotate
+        Passed to ax.annotate (or ``matplotlib.text.Text`` if ``collection=True``)
 
+    Returns
+    -------
+    labels : list of Annotation or MapTickLabels or DynamicMapTickLabels
+        The created labels. If ``ax`` is an iterable of axes, a list with the labels
+        of each axes (None for axes that are not labeled).
     """
 
     # get ax if necessary
     if ax is None:
         ax = plt.gca()
 
-    ax.figure.canvas.draw()
-
     labelpad, size, weight = _get_label_attr(labelpad, size, weight)
 
+    return _map_ticklabels(
+        _yticklabel_positions,
+        ax,
+        y_ticks,
+        labelpad,
+        outer_only="left" if outer_only else None,
+        dynamic=dynamic,
+        collection=collection,
+        ha=ha,
+        va=va,
+        size=size,
+        weight=weight,
+        bbox=bbox_props,
+        **kwargs,
+    )
+
+
+def _yticklabel_positions(ax, y_ticks, labelpad):
+
     boundary_pc = _get_boundary_platecarree(ax)
 
     # ensure labels are on rhs and not in the middle
@@ -331,35 +381,25 @@ def yticklabels(
         )
         warnings.warn(msg)
 
-    # get a transform instance that mpl understands
-    transform = ccrs.PlateCarree()._as_mpl_transform(ax)
-
     if np.isscalar(labelpad):
         labelpad = [labelpad, 0]
 
-    # loop through points
-    for y in y_label_points:
-        msg = LATITUDE_FORMATTER(y)
-
-        x = _determine_intersection(boundary_pc, [lonmin, y], [lonmax, y])
-
-        if x.size > 0:
-            x = x[:, 0].min()
-            lp = labelpad[0] + labelpad[1] * np.abs(y) / 90
-
-            ax.annotate(
-                msg,
-                xy=(x, y),
-                xycoords=transform,
-                ha=ha,
-                va=va,
-                size=size,
-                weight=weight,
-                xytext=(-lp, 0),
-                textcoords="offset points",
-                bbox=bbox_props,
-                **kwargs,
-            )
+    # intersect all ticks with the map boundary at once
+    y_label_points = np.asarray(y_label_points, dtype=float)
+    start = np.stack([np.full_like(y_label_points, lonmin), y_label_points], axis=-1)
+    end = np.stack([np.full_like(y_label_points, lonmax), y_label_points], axis=-1)
+    x_label_points = _determine_intersections(boundary_pc, start, end, axis=0)
+
+    # only keep ticks intersecting the boundary
+    sel = ~np.isnan(x_label_points)
+    x, y = x_label_points[sel], y_label_points[sel]
+
+    labels = [LATITUDE_FORMATTER(y_) for y_ in y]
+
+    lp = labelpad[0] + labelpad[1] * np.abs(y) / 90
+    offsets = np.stack([-lp, np.zeros_like(lp)], axis=-1)
+
+    return np.stack([x, y], axis=-1), labels, offsets
 
 
 @_deprecate_positional_args("0.3")
@@ -373,6 +413,9 @@ def xticklabels(
     ha="center",
     va="top",
     bbox_props=dict(ec="none", fc="none"),
+    collection=False,
+    outer_only=False,
+    dynamic=False,
     **kwargs,
 ):
     """draw xticklabels on map plots - may or may not work
@@ -390,7 +433,7 @@ def xticklabels(
     weight : string, optional
         Fontweight, defaults to mpl.rcParams['axes.labelweight'], usually
         'normal'.
-    ax : GeoAxes, optional
+    ax : GeoAxes | iterable of GeoAxes, optional
         Axes to add the labels to. Default plt.gca(.
     ha : string
         Horizontal alignment, default: 'center'.
@@ -398,17 +441,30 @@ def xticklabels(
         Vertical alignment, default: 'top'.
     bbox_props : dict
         Properties of the bounding box. Default: dict(ec='none', fc='none')
+    collection : bool, default: False
+        If True, all labels are drawn by a single ``MapTickLabels`` artist instead
+        of one annotation per label, which is faster to draw.
+    outer_only : bool, default: False
+        If True and ``ax`` is a grid of subplots, only label the axes in the
+        bottom row.
+    dynamic : bool, default: False
+        If True, the labels are drawn by a ``DynamicMapTickLabels`` artist, which
+        recomputes their positions when the extent of the map changes (e.g. after
+        ``set_extent`` or zooming). Implies ``collection=True``.
     **kwargs : additional arguments
-        Passed to ax.annotate
+        Passed to ax.annotate (or ``matplotlib.text.Text`` if ``collection=True``)
 
+    Returns
+    -------
+    labels : list of Annotation or MapTickLabels or DynamicMapTickLabels
+        The created labels. If ``ax`` is an iterable of axes, a list with the labels
+        of each axes (None for axes that are not labeled).
     """
 
     # get ax if necessary
     if ax is None:
         ax = plt.gca()
 
-    ax.figure.canvas.draw()
-
     # proj = ccrs.PlateCarree()
     # points = shapely.geometry.MultiPoint([shapely.geometry.Point(x, 0) for x in x_ticks])
     # points = proj.project_geometry(points, proj)
@@ -416,6 +472,25 @@ def xticklabels(
 
     labelpad, size, weight = _get_label_attr(labelpad, size, weight)
 
+    return _map_ticklabels(
+        _xticklabel_positions,
+        ax,
+        x_ticks,
+        labelpad,
+        outer_only="bottom" if outer_only else None,
+        dynamic=dynamic,
+        collection=collection,
+        ha=ha,
+        va=va,
+        size=size,
+        weight=weight,
+        bbox=bbox_props,
+        **kwargs,
+    )
+
+
+def _xticklabel_positions(ax, x_ticks, labelpad):
+
     boundary_pc = _get_boundary_platecarree(ax)
 
     # get the x_limit
@@ -431,63 +506,286 @@ def xticklabels(
         )
         warnings.warn(msg)
 
-    # get a transform instance that mpl understands
-    transform = ccrs.PlateCarree()._as_mpl_transform(ax)
+    # intersect all ticks with the map boundary at once
+    x_label_points = np.asarray(x_label_points, dtype=float)
+    start = np.stack([x_label_points, np.full_like(x_label_points, -90)], axis=-1)
+    end = np.stack([x_label_points, np.full_like(x_label_points, 90)], axis=-1)
+    y_label_points = _determine_intersections(boundary_pc, start, end, axis=1)
+
+    # only keep ticks intersecting the boundary
+    sel = ~np.isnan(y_label_points)
+    x, y = x_label_points[sel], y_label_points[sel]
+
+    labels = [LONGITUDE_FORMATTER(x_) for x_ in x]
+
+    offsets = np.zeros((len(x), 2))
+    offsets[:, 1] = -labelpad
+
+    return np.stack([x, y], axis=-1), labels, offsets
 
-    # loop through points
-    for x in x_label_points:
-        msg = LONGITUDE_FORMATTER(x)
-
-        y = _determine_intersection(boundary_pc, [x, -90], [x, 90])
-        if y.size > 0:
-            y = y[:, 1].min()
-
-            ax.annotate(
-                msg,
-                xy=(x, y),
-                xycoords=transform,
-                ha=ha,
-                va=va,
-                size=size,
-                weight=weight,
-                xytext=(0, -labelpad),
-                textcoords="offset points",
-                bbox=bbox_props,
+
+def _map_ticklabels(
+    get_positions, ax, ticks, labelpad, *, outer_only, dynamic, collection, **kwargs
+):
+
+    if isinstance(ax, plt.Axes):
+
+        if dynamic:
+            artist = DynamicMapTickLabels(ax, ticks, labelpad, get_positions, **kwargs)
+            ax.add_artist(artist)
+            return artist
+
+        xy, labels, offsets = get_positions(ax, ticks, labelpad)
+        return _add_map_ticklabels(
+            ax, xy, labels, offsets, collection=collection, **kwargs
+        )
+
+    # the map boundary is cached, so it is only computed once for all axes with the
+    # same projection and extent
+    return [
+        (
+            _map_ticklabels(
+                get_positions,
+                ax_,
+                ticks,
+                labelpad,
+                outer_only=None,
+                dynamic=dynamic,
+                collection=collection,
                 **kwargs,
             )
+            if _is_outer(ax_, outer_only)
+            else None
+        )
+        for ax_ in np.asarray(ax).flat
+    ]
+
+
+def _is_outer(ax, side):
+
+    if side is None:
+        return True
+
+    subplotspec = ax.get_subplotspec()
+
+    # axes that are not part of a grid are always labeled
+    if subplotspec is None:
+        return True
+
+    if side == "left":
+        return subplotspec.is_first_col()
+
+    return subplotspec.is_last_row()
+
+
+def _add_map_ticklabels(ax, xy, labels, offsets, *, collection, **kwargs):
+
+    # get a transform instance that mpl understands
+    transform = ccrs.PlateCarree()._as_mpl_transform(ax)
+
+    if collection:
+        artist = MapTickLabels(xy, labels, offsets, transform=transform, **kwargs)
+        ax.add_artist(artist)
+        return artist
+
+    return [
+        ax.annotate(
+            label,
+            xy=xy_,
+            xycoords=transform,
+            xytext=offset,
+            textcoords="offset points",
+            **kwargs,
+        )
+        for xy_, label, offset in zip(xy, labels, offsets)
+    ]
+
+
+class MapTickLabels(martist.Artist):
+    """draws all tick labels of a map as a single artist
+
+    The labels share the font properties and the transform and are drawn by reusing one
+    ``Text`` instance, which is much faster than one ``Annotation`` per label when
+    there are many labels (e.g. for a grid of maps).
+
+    Parameters
+    ----------
+    xy : array_like of shape (n, 2)
+        Positions of the labels in the coordinates of ``transform``.
+    labels : list of str
+        Text of the labels.
+    offsets : array_like of shape (n, 2)
+        Offset of the labels from ``xy`` in points.
+    transform : Transform
+        Transform of ``xy``.
+    **kwargs : keyword arguments
+        Properties of the labels, passed to ``matplotlib.text.Text``.
+    """
+
+    def __init__(self, xy, labels, offsets, *, transform, **kwargs):
+
+        super().__init__()
+
+        self.xy = np.asarray(xy, dtype=float).reshape(-1, 2)
+        self.labels = list(labels)
+        self.offsets = np.asarray(offsets, dtype=float).reshape(-1, 2)
+
+        self.set_transform(transform)
+        # like annotations - labels are placed outside of the map
+        self.set_clip_on(False)
+
+        self._text = mtext.Text(transform=mtransforms.IdentityTransform(), **kwargs)
+        self._text.set_clip_on(False)
+
+    def get_texts(self):
+        """return the labels as list of str"""
+        return list(self.labels)
+
+    def _iter_texts(self, renderer):
+        # position the shared text instance at each label (in display coordinates)
+
+        text = self._text
+        text.set_figure(self.figure)
+
+        xy = self.get_transform().transform(self.xy)
+        offsets = self.offsets * renderer.points_to_pixels(1.0)
+
+        for label, pos in zip(self.labels, xy + offsets):
+            text.set_text(label)
+            text.set_position(pos)
+            yield text
+
+    def get_window_extent(self, renderer=None):
+
+        if renderer is None:
+            renderer = self.figure._get_renderer()
+
+        bboxes = [t.get_window_extent(renderer) for t in self._iter_texts(renderer)]
+
+        if not bboxes:
+            return mtransforms.Bbox.null()
+
+        return mtransforms.Bbox.union(bboxes)
+
+    @martist.allow_rasterization
+    def draw(self, renderer):
+
+        if not self.get_visible():
+            return
+
+        for text in self._iter_texts(renderer):
+            text.draw(renderer)
+
+        self.stale = False
 
 
 def _get_boundary_platecarree(ax):
     # get the bounding box of the map in lat/ lon coordinates
+
+    # the path of the geo spine is the boundary of the projection clipped to the extent
+    # of the map; it is updated on draw but also by get_window_extent, which does not
+    # render the figure (see GeoSpine._adjust_location)
+    spine = ax.spines["geo"]
+    spine.get_window_extent()
+
+    vertices = np.ascontiguousarray(spine.get_path().vertices, dtype=float)
+
+    return _boundary_platecarree_cached(ax.projection, vertices.tobytes())
+
+
+@functools.lru_cache(maxsize=128)
+def _boundary_platecarree_cached(projection, vertices):
     # after ax._get_extent_geom
+    # cached - panels with the same projection and extent share the boundary
+
+    vertices = np.frombuffer(vertices, dtype=float).reshape(-1, 2)
+
     proj = ccrs.PlateCarree()
-    boundary_poly = shapely.geometry.Polygon(ax.spines["geo"].get_path().vertices)
-    eroded_boundary = boundary_poly.buffer(-ax.projection.threshold / 100)
-    boundary_pc = proj.project_geometry(eroded_boundary, ax.projection)
+    boundary_poly = shapely.geometry.Polygon(vertices)
+    eroded_boundary = boundary_poly.buffer(-projection.threshold / 100)
+    boundary_pc = proj.project_geometry(eroded_boundary, projection)
 
-    # boundary_pc = proj.project_geometry(boundary_poly, ax.projection)
+    # boundary_pc = proj.project_geometry(boundary_poly, projection)
 
     return boundary_pc
 
 
-def _determine_intersection(polygon, xy1, xy2):
-    p1 = shapely.geometry.Point(xy1)
-    p2 = shapely.geometry.Point(xy2)
-    ls = shapely.geometry.LineString([p1, p2])
+def _determine_intersections(polygon, start, end, axis):
+    """intersect the boundary of polygon with several lines at once
+
+    Returns the smallest coordinate along ``axis`` of the intersection points of each
+    line (from ``start[i]`` to ``end[i]``) or NaN if the line does not intersect.
+    """
 
-    intersection = polygon.boundary.intersection(ls)
+    lines = shapely.linestrings(np.stack([start, end], axis=1).reshape(-1, 2, 2))
 
-    if isinstance(intersection, shapely.geometry.MultiPoint):
-        arr = np.array([x.coords for x in intersection.geoms]).squeeze()
-    elif isinstance(intersection, shapely.geometry.Point):
-        arr = np.array([intersection.coords]).squeeze()
-        arr = np.atleast_2d(arr)
-    elif isinstance(intersection, shapely.geometry.LineString):
-        if intersection.is_empty:
-            return np.array([])
-        else:
-            return np.array(intersection.coords)
-    else:
-        raise TypeError(f"Unexpected type: {type(intersection)}")
+    intersections = shapely.intersection(polygon.boundary, lines)
+
+    coords, index = shapely.get_coordinates(intersections, return_index=True)
+
+    result = np.full(len(lines), np.nan)
+    np.fmin.at(result, index, coords[:, axis])
+
+    return result
+
+
+class DynamicMapTickLabels(MapTickLabels):
+    """tick labels of a map that follow changes of its extent
+
+    The positions of the labels are computed lazily when the labels are drawn and
+    only if the extent of the map changed since they were last computed.
+
+    Parameters
+    ----------
+    ax : GeoAxes
+        Axes to label.
+    ticks : 1D array
+        Position of the ticks.
+    labelpad : float or (float, float)
+        Distance of labels to the axes.
+    get_positions : callable
+        Function computing the label positions, called as
+        ``get_positions(ax, ticks, labelpad)``.
+    **kwargs : keyword arguments
+        Properties of the labels, passed to ``matplotlib.text.Text``.
+    """
+
+    def __init__(self, ax, ticks, labelpad, get_positions, **kwargs):
+
+        self.ticks = ticks
+        self.labelpad = labelpad
+        self.get_positions = get_positions
+
+        xy, labels, offsets = get_positions(ax, ticks, labelpad)
+        self._key = self._get_key(ax)
+
+        transform = ccrs.PlateCarree()._as_mpl_transform(ax)
+        super().__init__(xy, labels, offsets, transform=transform, **kwargs)
+
+    @staticmethod
+    def _get_key(ax):
+        # the positions are in map coordinates, so they only depend on the extent
+        return tuple(ax.viewLim.bounds)
+
+    def _update_positions(self):
+
+        ax = self.axes
+        key = self._get_key(ax)
+
+        if key == self._key:
+            return
+
+        # zooming to a region without ticks is not worth a warning on every draw
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            xy, labels, offsets = self.get_positions(ax, self.ticks, self.labelpad)
+
+        self.xy = xy
+        self.labels = labels
+        self.offsets = offsets
+        self._key = key
+
+    def _iter_texts(self, renderer):
 
-    return arr
+        self._update_positions()
+        return super()._iter_texts(renderer)
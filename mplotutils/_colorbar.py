@@ -1,3 +1,4 @@
+import contextlib
 import warnings
 
 import matplotlib as mpl
@@ -6,6 +7,7 @@ import matplotlib.transforms as mtransforms
 import numpy as np
 
 from mplotutils._deprecate import _deprecate_positional_args
+from mplotutils._mpl import _get_renderer
 
 
 def _deprecate_ax1_ax2(ax, ax2, ax1):
@@ -62,6 +64,7 @@ def colorbar(
     pad=None,
     shift="symmetric",
     shrink=None,
+    defer=False,
     **kwargs,
 ):
     """colorbar that adjusts to the axes height (and automatically resizes)
@@ -89,6 +92,11 @@ def colorbar(
         Fraction of the total height that the colorbar is shifted up/ right. See Note.
     shrink : None or float in 0..1, default: None.
         Fraction of the total height that the colorbar is shrunk. See Note.
+    defer : bool, default: False
+        If True, the position of the colorbar is not computed when it is created but
+        only when the figure is drawn. The figure is not drawn either way, so this only
+        saves computing the position of the colorbars once more (see also
+        ``mpu.batch_layout``).
     **kwargs : keyword arguments
         See Other Parameters.
 
@@ -254,150 +262,244 @@ def colorbar(
 
     cbar = f.colorbar(mappable, orientation=orientation, cax=cbax, **kwargs)
 
-    if orientation == "vertical":
-        func = _resize_colorbar_vert(
-            cbax,
-            f,
-            axs,
-            aspect=aspect,
-            size=size,
-            pad=pad,
-            shift=shift,
-            shrink=shrink,
-        )
-    else:
-        func = _resize_colorbar_horz(
-            cbax,
-            f,
-            axs,
-            aspect=aspect,
-            size=size,
-            pad=pad,
-            shift=shift,
-            shrink=shrink,
-        )
+    resizer = _ColorbarResizer(
+        cbax,
+        axs,
+        orientation,
+        aspect=aspect,
+        size=size,
+        pad=pad,
+        shift=shift,
+        shrink=shrink,
+    )
 
-    f.canvas.mpl_connect("draw_event", func)
-    f.canvas.draw()
+    layout = _ColorbarLayout.from_figure(f)
+    layout.add(resizer)
+
+    if not (defer or getattr(f, "_mplotutils_batch_layout", 0)):
+        layout.update()
 
     return cbar
 
 
+@contextlib.contextmanager
+def batch_layout(fig):
+    """defer updating the position of colorbars until the end of the context
+
+    Within this context ``mpu.colorbar`` does not compute the position of the
+    colorbar. Instead the position of all colorbars is computed once on exiting the
+    context. The figure is not drawn, neither within nor at the end of the context.
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        Figure to defer the layout updates for.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> import mplotutils as mpu
+
+    >>> f, axs = plt.subplots(3, 1)
+    >>> with mpu.batch_layout(f):
+    ...     for ax in axs:
+    ...         h = ax.pcolormesh([[0, 1]])
+    ...         cbar = mpu.colorbar(h, ax)
+    """
+
+    fig._mplotutils_batch_layout = getattr(fig, "_mplotutils_batch_layout", 0) + 1
+
+    try:
+        yield
+    finally:
+        fig._mplotutils_batch_layout -= 1
+
+    # only update when exiting the outermost context
+    if not fig._mplotutils_batch_layout:
+        _ColorbarLayout.from_figure(fig).update()
+
+
 # ========================================================================
 
 
 def _get_cbax(f):
-    # when using f.add_axes(rect) with the same rect twice
-    # it is the same axes, so we have to change rect
-    # slightly each time this func is called
+    # the position is set by the axes locator (see _ColorbarResizer)
+    return f.add_axes([0, 0, 0.1, 0.1])
 
-    n_axes = len(f.get_axes())
-    pos_incr = n_axes / 10.0
-    return f.add_axes([0, 0, 0.1, 0.1 + pos_incr])
 
+class _ColorbarLayout:
+    """keeps track of all mplotutils colorbars of one figure
 
-def _resize_colorbar_vert(
-    cbax,
-    f,
-    axs,
-    aspect=None,
-    size=None,
-    pad=None,
-    shift="symmetric",
-    shrink=None,
-):
+    The colorbars are positioned at draw time by their axes locator (see
+    ``_ColorbarResizer``), so no draw_event callback is required.
+    """
 
-    shift, shrink = _parse_shift_shrink(shift, shrink)
+    def __init__(self, fig):
 
-    size, aspect, pad = _parse_size_aspect_pad(size, aspect, pad, "vertical")
+        self.fig = fig
+        self.resizers = []
 
-    if aspect is not None:
-        anchor = (0, 0.5)
-        cbax.set_anchor(anchor)
-        cbax.set_box_aspect(aspect)
+    @classmethod
+    def from_figure(cls, fig):
+        # get the layout of the figure or create a new one
 
-    # inner function is called by event handler
-    def inner(event=None):
+        layout = getattr(fig, "_mplotutils_layout", None)
 
-        # from mpl.colorbar (but not using ax.get_position(original=True).frozen())
-        parents_bbox = mtransforms.Bbox.union([ax.get_position() for ax in axs])
+        if layout is None:
+            layout = cls(fig)
+            fig._mplotutils_layout = layout
 
-        # determine total height of all axes
-        full_height = parents_bbox.height
+        return layout
 
-        pad_scaled = pad * parents_bbox.width
+    def add(self, resizer):
 
-        # calculate position of cbax
-        left = parents_bbox.x1 + pad_scaled
+        resizer.cbax.set_axes_locator(resizer)
+        self.resizers.append(resizer)
 
-        bottom = parents_bbox.y0 + shift * full_height
+    def update(self):
+        """update the position of all colorbars without drawing the figure"""
 
-        height = (1 - shrink) * full_height
+        # forget colorbars that were removed from the figure
+        axes = self.fig.axes
+        self.resizers = [r for r in self.resizers if r.cbax in axes]
 
-        if aspect is None:
-            size_scaled = size * parents_bbox.width
-            width = size_scaled
-        else:
-            figure_aspect = np.divide(*f.get_size_inches())
-            width = height / (aspect * figure_aspect)
+        # parents with an axes locator (e.g. from AxesGrid) are only positioned on draw
+        parents = {ax for resizer in self.resizers for ax in resizer.axs}
+        located = [ax for ax in parents if ax.get_axes_locator() is not None]
+        if located:
+            renderer = _get_renderer(self.fig)
+            for ax in located:
+                ax.apply_aspect(ax.get_axes_locator()(ax, renderer))
 
-        pos = [left, bottom, width, height]
+        parent_bboxes = {}
+        for resizer in self.resizers:
 
-        cbax.set_position(pos)
+            # colorbars sharing the same parents only compute the bbox once
+            parents_bbox = parent_bboxes.get(resizer.axs)
+            if parents_bbox is None:
+                parents_bbox = resizer.parents_bbox()
+                parent_bboxes[resizer.axs] = parents_bbox
 
-    return inner
+            bbox = resizer.bbox(parents_bbox)
 
+            # same as done by the axes locator during the draw
+            resizer.cbax.set_position(bbox, which="original")
+            resizer.cbax.apply_aspect(bbox)
 
-# ====================================
+    def remove(self):
+        """stop resizing the colorbars - they keep their current position"""
 
+        self.update()
 
-def _resize_colorbar_horz(
-    cbax,
-    f,
-    axs,
-    aspect=None,
-    size=None,
-    pad=None,
-    shift="symmetric",
-    shrink=None,
-):
+        for resizer in self.resizers:
+            resizer.cbax.set_axes_locator(None)
+
+        self.resizers = []
+
+        if getattr(self.fig, "_mplotutils_layout", None) is self:
+            del self.fig._mplotutils_layout
+
+
+class _ColorbarResizer:
+    """axes locator computing the position of a colorbar from its parent axes
 
-    shift, shrink = _parse_shift_shrink(shift, shrink)
+    As the position is computed when the colorbar axes is drawn, the colorbar is
+    placed correctly within a single draw. The class only holds references to axes
+    and numbers, such that figures can be pickled (e.g. to render them in another
+    process) without having to reconnect any callbacks.
+    """
+
+    def __init__(
+        self,
+        cbax,
+        axs,
+        orientation,
+        *,
+        aspect=None,
+        size=None,
+        pad=None,
+        shift="symmetric",
+        shrink=None,
+    ):
+
+        self.cbax = cbax
+        self.axs = tuple(axs)
+        self.orientation = orientation
+
+        self.shift, self.shrink = _parse_shift_shrink(shift, shrink)
+
+        size, aspect, pad = _parse_size_aspect_pad(size, aspect, pad, orientation)
 
-    size, aspect, pad = _parse_size_aspect_pad(size, aspect, pad, "horizontal")
+        if aspect is not None:
+            if orientation == "vertical":
+                anchor = (0, 0.5)
+            else:
+                aspect = 1 / aspect
+                anchor = (0.5, 1.0)
 
-    if aspect is not None:
-        aspect = 1 / aspect
-        anchor = (0.5, 1.0)
-        cbax.set_anchor(anchor)
-        cbax.set_box_aspect(aspect)
+            cbax.set_anchor(anchor)
+            cbax.set_box_aspect(aspect)
 
-    def inner(event=None):
+        self.size, self.aspect, self.pad = size, aspect, pad
 
+    def __call__(self, ax, renderer):
+        return self.bbox(self.parents_bbox())
+
+    def parents_bbox(self):
         # from mpl.colorbar (but not using ax.get_position(original=True).frozen())
-        parents_bbox = mtransforms.Bbox.union([ax.get_position() for ax in axs])
+        return mtransforms.Bbox.union([ax.get_position() for ax in self.axs])
+
+    def bbox(self, parents_bbox):
+        return mtransforms.Bbox.from_bounds(*self.position(parents_bbox))
+
+    def position(self, parents_bbox):
+
+        if self.orientation == "vertical":
+            return self._position_vert(parents_bbox)
+        return self._position_horz(parents_bbox)
+
+    def _position_vert(self, parents_bbox):
+
+        # determine total height of all axes
+        full_height = parents_bbox.height
+
+        pad_scaled = self.pad * parents_bbox.width
+
+        # calculate position of cbax
+        left = parents_bbox.x1 + pad_scaled
+
+        bottom = parents_bbox.y0 + self.shift * full_height
+
+        height = (1 - self.shrink) * full_height
+
+        if self.aspect is None:
+            size_scaled = self.size * parents_bbox.width
+            width = size_scaled
+        else:
+            figure_aspect = np.divide(*self.cbax.figure.get_size_inches())
+            width = height / (self.aspect * figure_aspect)
+
+        return [left, bottom, width, height]
+
+    def _position_horz(self, parents_bbox):
 
         full_width = parents_bbox.width
 
-        pad_scaled = pad * parents_bbox.height
+        pad_scaled = self.pad * parents_bbox.height
 
-        width = (1 - shrink) * full_width
+        width = (1 - self.shrink) * full_width
 
-        if aspect is None:
-            size_scaled = size * parents_bbox.height
+        if self.aspect is None:
+            size_scaled = self.size * parents_bbox.height
             height = size_scaled
         else:
-            figure_aspect = np.divide(*f.get_size_inches())
-            height = width * (aspect * figure_aspect)
+            figure_aspect = np.divide(*self.cbax.figure.get_size_inches())
+            height = width * (self.aspect * figure_aspect)
 
-        left = parents_bbox.x0 + shift * full_width
+        left = parents_bbox.x0 + self.shift * full_width
         bottom = parents_bbox.y0 - (pad_scaled + height)
 
-        pos = [left, bottom, width, height]
-
-        cbax.set_position(pos)
-
-    return inner
+        return [left, bottom, width, height]
 
 
 # ====================================
@@ -1,52 +1,95 @@
 import warnings
+import weakref
 
 import cartopy.crs as ccrs
 import matplotlib as mpl
+import matplotlib.legend
+import matplotlib.legend_handler
 import numpy as np
+import shapely
+import shapely.geometry
 import xarray as xr
 from packaging.version import Version
 
 import mplotutils as mpu
 
-_HATCHES_PER_FIGURE = {}
+# figures are only weakly referenced so they can be garbage collected
+_HATCHES_PER_FIGURE = weakref.WeakKeyDictionary()
 
 
 from mplotutils._mpl import _maybe_gca
+from mplotutils._xrcompat import _infer_interval_breaks
 
 MPL_GE_310 = Version(Version(mpl.__version__).base_version) >= Version("3.10")
 MPL_GE_311 = Version(Version(mpl.__version__).base_version) >= Version("3.11")
 
 
-def hatch(da, hatch, *, ax=None, label=None, linewidth=None, color="0.1"):
+def hatch(
+    da,
+    hatch,
+    *,
+    ax=None,
+    label=None,
+    linewidth=None,
+    color="0.1",
+    coarsen="auto",
+    engine="contourf",
+    simplify=None,
+):
     """add hatch pattern to an axes
 
     Parameters
     ----------
-    da : xr.DataArray
+    da : xr.DataArray | dict of xr.DataArray
         DataArray with the hatch information, must be boolean 2D array. Data of value
-        `True` is hatched.
-    hatch : str
+        `True` is hatched. To draw several hatch patterns at once, pass a dict of
+        boolean arrays (the keys are used as legend labels) or an integer array of
+        categories (1 is hatched with the first pattern, 2 with the second, ...).
+    hatch : str | list of str
         Hatch pattern, one of: '/', '\\', '|', '-', '+', 'x', 'o', 'O', '.', '*'.
-        Hatching patterns can be repeated to increase the density.
+        Hatching patterns can be repeated to increase the density. Pass one pattern
+        per mask or category to draw several hatch patterns.
     ax : matplotlib.axes, default: None
         Axes to draw the hatch on. If not given, uses the current axes or creates new
         axes.
-    label : str
-        label for a legend entry
+    label : str | list of str
+        label for a legend entry (one per hatch pattern)
     linewidth : float, default: 0.25
         Default thickness of the hatching. Note that only one linewidth per figure is
-        supported (by matplotlib).
+        supported for matplotlib < 3.10.
     color : matplotlib color, default: "0.1"
         Color of the hatch lines.
+    coarsen : bool or "auto", default: "auto"
+        Whether to coarsen the mask to the resolution of the axes before drawing the
+        hatch, considering only the part of the mask within the extent of the axes.
+        Cells are merged into blocks and a block is hatched if the majority of
+        its cells are `True`. If "auto" only dask-backed masks are coarsened, which
+        avoids loading the full mask into memory.
+    engine : {"contourf", "cells"}, default: "contourf"
+        How the hatched area is computed. "contourf" draws the hatch with
+        ``contourf``, which interpolates between the cell centers. "cells" merges the
+        `True` cells into rectangles bounded by the cell edges and draws them as one
+        ``PathCollection``, which is faster and exact for gridded masks. Several
+        hatch patterns require "contourf".
+    simplify : float, optional
+        Only for ``engine="cells"``. If given, the cells are merged into polygons
+        (i.e., their union) and simplified with this tolerance in points (at the
+        current size of the axes). On maps the polygons are projected once, when the
+        hatch is created. This considerably reduces the size of vector output (pdf,
+        svg). Use 0 to only merge the cells.
 
     Returns
     -------
-    `~.contour.QuadContourSet`
+    `~.contour.QuadContourSet` or `~.collections.PathCollection`
 
     Notes
     -----
     Don't use this function to hatch levels of a contour plot - it's better to add
     hatches directly to `countourf`.
+
+    Several hatch patterns are drawn with one call to `contourf` (and a single cyclic
+    point), which is considerably faster than one call per pattern. Overlapping masks
+    are not supported - where masks overlap the later pattern is drawn.
     """
 
     return _hatch(
@@ -58,43 +101,81 @@ def hatch(da, hatch, *, ax=None, label=None, linewidth=None, color="0.1"):
         color=color,
         cyclic=False,
         transform=None,
+        coarsen=coarsen,
+        engine=engine,
+        simplify=simplify,
     )
 
 
 def hatch_map(
-    da, hatch, *, ax=None, label=None, linewidth=None, color="0.1", transform=None
+    da,
+    hatch,
+    *,
+    ax=None,
+    label=None,
+    linewidth=None,
+    color="0.1",
+    transform=None,
+    coarsen="auto",
+    engine="contourf",
+    simplify=None,
 ):
     """add hatch pattern to a regional cartopy map
 
     Parameters
     ----------
-    da : xr.DataArray
+    da : xr.DataArray | dict of xr.DataArray
         DataArray with the hatch information, must be boolean 2D array. Data of value
-        `True` is hatched.
-    hatch : str
+        `True` is hatched. To draw several hatch patterns at once, pass a dict of
+        boolean arrays (the keys are used as legend labels) or an integer array of
+        categories (1 is hatched with the first pattern, 2 with the second, ...).
+    hatch : str | list of str
         Hatch pattern, one of: '/', '\\', '|', '-', '+', 'x', 'o', 'O', '.', '*'.
-        Hatching patterns can be repeated to increase the density.
+        Hatching patterns can be repeated to increase the density. Pass one pattern
+        per mask or category to draw several hatch patterns.
     ax : matplotlib.axes, default: None
         Axes to draw the hatch on. If not given, uses the current axes or creates new
         axes.
-    label : str
-        label for a legend entry
+    label : str | list of str
+        label for a legend entry (one per hatch pattern)
     linewidth : float, default: 0.25
         Default thickness of the hatching. Note that only one linewidth per figure is
-        supported (by matplotlib).
+        supported for matplotlib < 3.10.
     color : matplotlib color, default: "0.1"
         Color of the hatch lines.
+    coarsen : bool or "auto", default: "auto"
+        Whether to coarsen the mask to the resolution of the axes before drawing the
+        hatch, considering only the part of the mask within the extent of the axes.
+        Cells are merged into blocks and a block is hatched if the majority of
+        its cells are `True`. If "auto" only dask-backed masks are coarsened, which
+        avoids loading the full mask into memory.
+    engine : {"contourf", "cells"}, default: "contourf"
+        How the hatched area is computed. "contourf" draws the hatch with
+        ``contourf``, which interpolates between the cell centers. "cells" merges the
+        `True` cells into rectangles bounded by the cell edges and draws them as one
+        ``PathCollection``, which is faster and exact for gridded masks. Several
+        hatch patterns require "contourf".
+    simplify : float, optional
+        Only for ``engine="cells"``. If given, the cells are merged into polygons
+        (i.e., their union) and simplified with this tolerance in points (at the
+        current size of the axes). On maps the polygons are projected once, when the
+        hatch is created. This considerably reduces the size of vector output (pdf,
+        svg). Use 0 to only merge the cells.
     transform : cartopy projection, optional
         Defines the transformation of the data. If None uses 'PlateCarree'.
 
     Returns
     -------
-    `~.contour.QuadContourSet`
+    `~.contour.QuadContourSet` or `~.collections.PathCollection`
 
     Notes
     -----
     Don't use this function to hatch levels of a contour plot - it's better to add
     hatches directly to `countourf`.
+
+    Several hatch patterns are drawn with one call to `contourf` (and a single cyclic
+    point), which is considerably faster than one call per pattern. Overlapping masks
+    are not supported - where masks overlap the later pattern is drawn.
     """
 
     if transform is None:
@@ -109,43 +190,81 @@ def hatch_map(
         color=color,
         cyclic=False,
         transform=transform,
+        coarsen=coarsen,
+        engine=engine,
+        simplify=simplify,
     )
 
 
 def hatch_map_global(
-    da, hatch, *, ax=None, label=None, linewidth=None, color="0.1", transform=None
+    da,
+    hatch,
+    *,
+    ax=None,
+    label=None,
+    linewidth=None,
+    color="0.1",
+    transform=None,
+    coarsen="auto",
+    engine="contourf",
+    simplify=None,
 ):
     """add hatch pattern to a global cartopy map - adds a cyclic data point
 
     Parameters
     ----------
-    da : xr.DataArray
+    da : xr.DataArray | dict of xr.DataArray
         DataArray with the hatch information, must be boolean 2D array. Data of value
-        `True` is hatched.
-    hatch : str
+        `True` is hatched. To draw several hatch patterns at once, pass a dict of
+        boolean arrays (the keys are used as legend labels) or an integer array of
+        categories (1 is hatched with the first pattern, 2 with the second, ...).
+    hatch : str | list of str
         Hatch pattern, one of: '/', '\\', '|', '-', '+', 'x', 'o', 'O', '.', '*'.
-        Hatching patterns can be repeated to increase the density.
+        Hatching patterns can be repeated to increase the density. Pass one pattern
+        per mask or category to draw several hatch patterns.
     ax : matplotlib.axes, default: None
         Axes to draw the hatch on. If not given, uses the current axes or creates new
         axes.
-    label : str
-        label for a legend entry
+    label : str | list of str
+        label for a legend entry (one per hatch pattern)
     linewidth : float, default: 0.25
         Default thickness of the hatching. Note that only one linewidth per figure is
-        supported (by matplotlib).
+        supported for matplotlib < 3.10.
     color : matplotlib color, default: "0.1"
         Color of the hatch lines.
+    coarsen : bool or "auto", default: "auto"
+        Whether to coarsen the mask to the resolution of the axes before drawing the
+        hatch, considering only the part of the mask within the extent of the axes.
+        Cells are merged into blocks and a block is hatched if the majority of
+        its cells are `True`. If "auto" only dask-backed masks are coarsened, which
+        avoids loading the full mask into memory.
+    engine : {"contourf", "cells"}, default: "contourf"
+        How the hatched area is computed. "contourf" draws the hatch with
+        ``contourf``, which interpolates between the cell centers. "cells" merges the
+        `True` cells into rectangles bounded by the cell edges and draws them as one
+        ``PathCollection``, which is faster and exact for gridded masks. Several
+        hatch patterns require "contourf".
+    simplify : float, optional
+        Only for ``engine="cells"``. If given, the cells are merged into polygons
+        (i.e., their union) and simplified with this tolerance in points (at the
+        current size of the axes). On maps the polygons are projected once, when the
+        hatch is created. This considerably reduces the size of vector output (pdf,
+        svg). Use 0 to only merge the cells.
     transform : cartopy projection, optional
         Defines the transformation of the data. If None uses 'PlateCarree'.
 
     Returns
     -------
-    `~.contour.QuadContourSet`
+    `~.contour.QuadContourSet` or `~.collections.PathCollection`
 
     Notes
     -----
     Don't use this function to hatch levels of a contour plot - it's better to add
     hatches directly to `countourf`.
+
+    Several hatch patterns are drawn with one call to `contourf` (and a single cyclic
+    point), which is considerably faster than one call per pattern. Overlapping masks
+    are not supported - where masks overlap the later pattern is drawn.
     """
 
     if transform is None:
@@ -160,6 +279,9 @@ def hatch_map_global(
         color=color,
         cyclic=True,
         transform=transform,
+        coarsen=coarsen,
+        engine=engine,
+        simplify=simplify,
     )
 
 
@@ -173,16 +295,21 @@ def _hatch(
     color="0.1",
     cyclic=False,
     transform=None,
+    coarsen="auto",
+    engine="contourf",
+    simplify=None,
 ):
 
-    if not isinstance(da, xr.DataArray):
-        raise TypeError(f"Expected a xr.DataArray, got {type(da)}.")
+    if engine not in ("contourf", "cells"):
+        raise ValueError(f"engine must be one of 'contourf' or 'cells', got {engine!r}")
+
+    if simplify is not None and engine != "cells":
+        raise ValueError("simplify is only supported for engine='cells'")
 
-    if not np.issubdtype(da.dtype, bool):
-        raise TypeError(f"Expected a boolean array, got {da.dtype}")
+    masks, hatches, labels = _get_masks(da, hatch, label)
 
-    if da.ndim != 2:
-        raise ValueError(f"Expected a 2D array, got {da.ndim=}")
+    if len(masks) > 1 and engine != "contourf":
+        raise ValueError("Several hatch patterns are only supported for 'contourf'")
 
     if ax is None:
         ax = _maybe_gca()
@@ -207,47 +334,393 @@ def _hatch(
             mpl.rcParams["hatch.linewidth"] = linewidth
 
             _HATCHES_PER_FIGURE[fig] = linewidth
-    else:
-        if linewidth is None:
-            mpl.rcParams["hatch.linewidth"] = 0.25
-        else:
-            mpl.rcParams["hatch.linewidth"] = linewidth
 
-    mpl.rcParams["hatch.color"] = color
+        mpl.rcParams["hatch.color"] = color
+
+    elif linewidth is None:
+        # the linewidth and color are set per artist - don't change the rcParams
+        linewidth = 0.25
+
+    for hatch_, label_ in zip(hatches, labels):
+
+        if label_ is None:
+            continue
 
-    if label is not None:
         # add an empty patch to generate a legend entry
         xy = np.full((0, 2), fill_value=np.nan)
-        empty_legend_patch = mpl.patches.Polygon(
+        empty_legend_patch = _HatchLegendPatch(
             xy,
             facecolor="none",
             ec="0.1",
-            hatch=hatch,
-            label=label,
+            hatch=hatch_,
+            label=label_,
         )
 
-        hatch_color = mpl.colors.to_rgba(mpl.rcParams["hatch.color"])
-
-        if not MPL_GE_311:
-            # NOTE: manually overwrites the private _hatch_color property - allows to
-            # have different ec and hatch color (so the box of the legend is black)
-            empty_legend_patch._hatch_color = hatch_color
-        else:
-            # TODO: is  this still needed in MPL_GE_311?
-            empty_legend_patch.set_hatchcolor(hatch_color)
+        # allows to have different ec and hatch color (so the box of the legend is
+        # black)
+        _set_hatch_style(empty_legend_patch, linewidth, color)
 
         ax.add_patch(empty_legend_patch)
 
-    if cyclic:
-        _, lon_dim = da.dims
-        da = mpu.cyclic_dataarray(da, lon_dim)
+    masks = [
+        (
+            _coarsen_to_axes(mask, ax, transform)
+            if coarsen is True or (coarsen == "auto" and mask.chunks is not None)
+            else mask
+        )
+        for mask in masks
+    ]
 
-    return da.plot.contourf(
-        ax=ax,
-        hatches=["", hatch],
-        levels=[0, 0.5, 1],
-        colors="none",
-        extend="neither",
+    if len(masks) == 1:
+        (da,) = masks
+        levels = [0, 0.5, 1]
+    else:
+        # combine the masks into one array of categories - later masks take precedence
+        da = xr.zeros_like(masks[0], dtype=int)
+        for i, mask in enumerate(masks, start=1):
+            da = xr.where(mask, i, da)
+
+        levels = np.arange(len(masks) + 2) - 0.5
+
+    if engine == "cells":
+        # the cells extend to the edges of the grid - no cyclic point required
+        h = _hatch_cells(da, hatches[0], ax=ax, transform=transform, simplify=simplify)
+    else:
+        if cyclic:
+            _, lon_dim = da.dims
+            da = mpu.cyclic_dataarray(da, lon_dim)
+
+        # all levels are drawn in one pass and with one cyclic point
+        h = da.plot.contourf(
+            ax=ax,
+            hatches=["", *hatches],
+            levels=levels,
+            colors="none",
+            extend="neither",
+            transform=transform,
+            add_colorbar=False,
+        )
+
+    _set_hatch_style(h, linewidth, color)
+
+    # keep the options so the hatch can be redrawn with new data (FigureTemplate)
+    h._mplotutils_hatch = dict(
+        hatch=hatch,
+        linewidth=linewidth,
+        color=color,
+        cyclic=cyclic,
         transform=transform,
-        add_colorbar=False,
+        coarsen=coarsen,
+        engine=engine,
+        simplify=simplify,
+    )
+
+    return h
+
+
+def _get_masks(da, hatch, label):
+    """normalize the input to lists of 2D boolean masks, hatches, and labels"""
+
+    multi_level = not isinstance(hatch, str)
+    hatches = list(hatch) if multi_level else [hatch]
+    n_levels = len(hatches)
+
+    if isinstance(da, dict):
+        masks = list(da.values())
+        label = list(da) if label is None else label
+    elif isinstance(da, xr.DataArray) and multi_level and da.dtype != bool:
+
+        if not np.issubdtype(da.dtype, np.integer):
+            raise TypeError(f"Expected a boolean or integer array, got {da.dtype}")
+
+        # categories: 1 is hatched with the first pattern, 2 with the second etc.
+        masks = [da == i for i in range(1, n_levels + 1)]
+    else:
+        masks = [da]
+
+    for mask in masks:
+        if not isinstance(mask, xr.DataArray):
+            raise TypeError(f"Expected a xr.DataArray, got {type(mask)}.")
+
+        if not np.issubdtype(mask.dtype, bool):
+            raise TypeError(f"Expected a boolean array, got {mask.dtype}")
+
+        if mask.ndim != 2:
+            raise ValueError(f"Expected a 2D array, got {mask.ndim=}")
+
+    if len(masks) != n_levels:
+        raise ValueError(
+            f"Expected one hatch pattern per mask, got {n_levels} hatch pattern(s) "
+            f"for {len(masks)} mask(s)"
+        )
+
+    labels = [label] if isinstance(label, str) or label is None else list(label)
+    labels = labels * n_levels if label is None else labels
+
+    if len(labels) != n_levels:
+        raise ValueError(
+            f"Expected one label per hatch pattern, got {len(labels)} label(s) "
+            f"for {n_levels} hatch pattern(s)"
+        )
+
+    return masks, hatches, labels
+
+
+class _HatchLegendPatch(mpl.patches.Polygon):
+    """empty patch generating the legend entry of a hatch"""
+
+
+def _update_hatch_legend_handle(legend_handle, orig_handle):
+
+    legend_handle.update_from(orig_handle)
+
+    # update_from does not copy the hatch linewidth
+    legend_handle.set_hatch_linewidth(orig_handle.get_hatch_linewidth())
+
+
+if MPL_GE_310:
+    # the linewidth of the hatch is set per artist - also use it in the legend
+    mpl.legend.Legend.update_default_handler_map(
+        {
+            _HatchLegendPatch: mpl.legend_handler.HandlerPatch(
+                update_func=_update_hatch_legend_handle
+            )
+        }
     )
+
+
+def _set_hatch_style(artist, linewidth, color):
+
+    hatch_color = mpl.colors.to_rgba(color)
+
+    if not MPL_GE_310:
+        # NOTE: the linewidth is read from the rcParams when the figure is drawn
+        artist._hatch_color = hatch_color
+        return
+
+    artist.set_hatch_linewidth(linewidth)
+
+    if not MPL_GE_311:
+        # NOTE: manually overwrites the private _hatch_color property
+        artist._hatch_color = hatch_color
+    else:
+        artist.set_hatchcolor(hatch_color)
+
+
+def _hatch_cells(da, hatch, *, ax, transform, simplify):
+
+    y_dim, x_dim = da.dims
+
+    x_edges = _infer_interval_breaks(da[x_dim].values)
+    y_edges = _infer_interval_breaks(da[y_dim].values)
+
+    rectangles = _mask_to_rectangles(da.values)
+
+    if simplify is None:
+        path = _rectangles_to_path(rectangles, x_edges, y_edges)
+        transform = (
+            ax.transData if transform is None else transform._as_mpl_transform(ax)
+        )
+    else:
+        path = _simplified_path(rectangles, x_edges, y_edges, ax, transform, simplify)
+        # the path is in the data coordinates of the axes (projected for maps)
+        transform = ax.transData
+
+    h = mpl.collections.PathCollection(
+        [path],
+        facecolors="none",
+        edgecolors="none",
+        hatch=hatch,
+        transform=transform,
+    )
+
+    ax.add_collection(h)
+    ax.autoscale_view()
+
+    return h
+
+
+def _simplified_path(rectangles, x_edges, y_edges, ax, transform, tolerance):
+    """merge the rectangles, project them to the map, and simplify them"""
+
+    if not len(rectangles):
+        return mpl.path.Path(np.empty((0, 2)))
+
+    row0, row1, col0, col1 = rectangles.T
+    boxes = shapely.box(x_edges[col0], y_edges[row0], x_edges[col1], y_edges[row1])
+
+    geom = shapely.union_all(boxes)
+
+    if transform is not None:
+        # project once instead of on every draw
+        geom = ax.projection.project_geometry(geom, transform)
+
+    # convert the tolerance from points to data units
+    pixel = np.abs(np.diff(ax.transData.inverted().transform([[0, 0], [1, 1]]), axis=0))
+    tolerance = tolerance * ax.figure.dpi / 72 * pixel.min()
+
+    geom = shapely.simplify(geom, tolerance, preserve_topology=True)
+
+    return _polygons_to_path(geom)
+
+
+def _polygons_to_path(geom):
+    """convert (multi)polygons to one compound path"""
+
+    polygons = shapely.get_parts(geom)
+    polygons = polygons[shapely.get_type_id(polygons) == 3]
+
+    # holes must be oriented opposite to the exterior to be left out
+    polygons = [shapely.geometry.polygon.orient(p) for p in polygons]
+
+    rings = shapely.get_rings(polygons)
+    vertices, index = shapely.get_coordinates(rings, return_index=True)
+
+    Path = mpl.path.Path
+
+    # e.g. if the mask is not visible on the map
+    if not len(vertices):
+        return Path(np.empty((0, 2)))
+
+    codes = np.full(len(vertices), Path.LINETO, dtype=Path.code_type)
+
+    # the first vertex of each ring starts a new path, the last one closes it
+    first = np.flatnonzero(np.diff(index, prepend=-1))
+    codes[first] = Path.MOVETO
+    codes[np.append(first[1:], len(vertices)) - 1] = Path.CLOSEPOLY
+
+    return Path(vertices, codes)
+
+
+def _mask_to_rectangles(mask):
+    """merge the True cells of a 2D boolean array into rectangles
+
+    Consecutive True cells of a row are merged into runs and runs with the same start
+    and end in consecutive rows are merged into one rectangle.
+
+    Returns
+    -------
+    rectangles : ndarray of shape (n, 4)
+        Index of the first row, last row (exclusive), first column, and last column
+        (exclusive) of each rectangle.
+    """
+
+    mask = np.asarray(mask, dtype=bool)
+    n_rows, n_cols = mask.shape
+
+    # find the start and end of all runs at once
+    padded = np.zeros((n_rows, n_cols + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    diff = np.diff(padded, axis=1)
+
+    # np.nonzero returns the indices in row-major order, so starts and ends pair up
+    rows, starts = np.nonzero(diff == 1)
+    _, ends = np.nonzero(diff == -1)
+
+    # group the runs by row
+    split = np.flatnonzero(np.diff(rows)) + 1
+    groups = zip(np.split(rows, split), np.split(starts, split), np.split(ends, split))
+
+    rectangles = []
+    # maps the (start, end) of the runs of the previous row to their first row
+    open_runs = {}
+    previous_row = -2
+
+    for row, row_starts, row_ends in groups:
+
+        if not row.size:
+            continue
+
+        row = int(row[0])
+        continues = row == previous_row + 1
+
+        runs = {}
+        for run in zip(row_starts.tolist(), row_ends.tolist()):
+            runs[run] = open_runs.pop(run) if continues and run in open_runs else row
+
+        # the remaining runs do not continue in this row
+        for (start, end), first_row in open_runs.items():
+            rectangles.append((first_row, previous_row + 1, start, end))
+
+        open_runs = runs
+        previous_row = row
+
+    for (start, end), first_row in open_runs.items():
+        rectangles.append((first_row, previous_row + 1, start, end))
+
+    return np.array(rectangles, dtype=int).reshape(-1, 4)
+
+
+def _rectangles_to_path(rectangles, x_edges, y_edges):
+    """build one compound path of closed rectangles"""
+
+    row0, row1, col0, col1 = rectangles.T
+    x0, x1 = x_edges[col0], x_edges[col1]
+    y0, y1 = y_edges[row0], y_edges[row1]
+
+    corners = [(x0, y0), (x1, y0), (x1, y1), (x0, y1), (x0, y0)]
+    vertices = np.stack([np.stack(c, axis=-1) for c in corners], axis=1)
+
+    Path = mpl.path.Path
+    codes = [Path.MOVETO, Path.LINETO, Path.LINETO, Path.LINETO, Path.CLOSEPOLY]
+    codes = np.tile(np.array(codes, dtype=Path.code_type), len(rectangles))
+
+    return Path(vertices.reshape(-1, 2), codes)
+
+
+def _coarsen_to_axes(da, ax, transform=None):
+    """coarsen a 2D boolean mask to (about) the resolution of the axes
+
+    Uses at least two cells per pixel of the visible part of the mask (i.e., also for
+    figures saved with a higher dpi) and only factors that divide the size of the
+    dimension - such that the coords stay equally spaced.
+    """
+
+    # dims of the mask are (y, x)
+    n_pixels = dict(zip(da.dims, (ax.bbox.height, ax.bbox.width)))
+    n_visible = _n_visible_cells(da, ax, transform)
+
+    factors = {}
+    for dim, size in da.sizes.items():
+        max_factor = int(n_visible[dim] // (2 * n_pixels[dim]))
+        factor = _largest_divisor(size, max_factor)
+
+        if factor > 1:
+            factors[dim] = factor
+
+    if not factors:
+        return da
+
+    # a block is hatched if the majority of its cells is True (lazy for dask)
+    return da.coarsen(factors, boundary="exact").mean() >= 0.5
+
+
+def _n_visible_cells(da, ax, transform):
+    """number of cells of the mask along each dim within the view limits of ax"""
+
+    # the limits follow the data - the whole mask is visible
+    if ax.get_autoscalex_on() and ax.get_autoscaley_on():
+        return dict(da.sizes)
+
+    if isinstance(transform, ccrs.CRS):
+        x0, x1, y0, y1 = ax.get_extent(crs=transform)
+    else:
+        trans = ax.transData if transform is None else transform
+        (x0, y0), (x1, y1) = (ax.transData - trans).transform(ax.viewLim.get_points())
+
+    n_visible = {}
+    for dim, (lower, upper) in zip(da.dims, ((y0, y1), (x0, x1))):
+        lower, upper = sorted((lower, upper))
+        coord = da[dim].values
+        n_visible[dim] = int(((coord >= lower) & (coord <= upper)).sum())
+
+    return n_visible
+
+
+def _largest_divisor(n, max_factor):
+
+    for factor in range(max(max_factor, 1), 1, -1):
+        if n % factor == 0:
+            return factor
+
+    return 1
@@ -6,7 +6,7 @@ import numpy as np
 from mpl_toolkits.axes_grid1 import AxesGrid
 
 from mplotutils._deprecate import _deprecate_positional_args
-from mplotutils._mpl import _get_renderer
+from mplotutils._mpl import _get_renderer, _layout_draw
 
 
 @_deprecate_positional_args("0.3")
@@ -69,7 +69,7 @@ def _set_map_layout_axes(axs, width, nrow, ncol):
         raise RuntimeError("matplotlib SubFigure not supported")
 
     # getting the correct data ratio of geoaxes requires draw
-    f.canvas.draw()
+    _layout_draw(f)
 
     bottom = f.subplotpars.bottom
     top = f.subplotpars.top
@@ -110,7 +110,7 @@ def _set_map_layout_axes_grid(axgr, width, nrow, ncol):
     f = ax.get_figure()
 
     # getting the correct data ratio of geoaxes requires draw
-    f.canvas.draw()
+    _layout_draw(f)
 
     bottom = f.subplotpars.bottom
     top = f.subplotpars.top
@@ -28,3 +28,14 @@ def _maybe_gca(**kwargs):
         return plt.gca()
 
     return plt.axes(**kwargs)
+
+
+def _layout_draw(fig):
+    """draw the figure without rendering any artists
+
+    Updates the layout (e.g. the position of GeoAxes and of mplotutils colorbars and the
+    map boundary) without rasterizing the data, which can be expensive. Note that this
+    triggers the draw_event.
+    """
+
+    fig.draw_without_rendering()
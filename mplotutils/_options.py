@@ -0,0 +1,77 @@
+import os
+import warnings
+
+_AUTODRAW_OPTIONS = ("all", "never")
+
+
+def _autodraw_from_env():
+
+    value = os.environ.get("MPLOTUTILS_AUTODRAW", "all")
+
+    if value not in _AUTODRAW_OPTIONS:
+        warnings.warn(
+            f"Invalid value for 'MPLOTUTILS_AUTODRAW' ({value!r}), expected one of "
+            f"{_AUTODRAW_OPTIONS}. Using 'all'."
+        )
+        value = "all"
+
+    return value
+
+
+OPTIONS = {"autodraw": _autodraw_from_env()}
+
+_VALIDATORS = {"autodraw": lambda value: value in _AUTODRAW_OPTIONS}
+
+
+class set_options:
+    """set options for mplotutils - globally or in a context manager
+
+    Parameters
+    ----------
+    autodraw : {"all", "never"}, default: "all"
+        Which figures are drawn before they are saved (see ``mpu.autodraw``).
+
+        - "all": draw every figure before saving it, except figures with a colorbar
+          created by ``mpu.colorbar``.
+        - "never": never draw a figure before saving it, i.e., every figure is
+          rendered only once.
+
+        Figures with a colorbar created by ``mpu.colorbar`` are never drawn
+        beforehand, because the colorbar is positioned within the draw. Neither
+        ``mpu.colorbar`` nor ``mpu.xticklabels`` and ``mpu.yticklabels`` draw the
+        figure.
+
+        The default can be set with the ``MPLOTUTILS_AUTODRAW`` environment variable.
+
+    Examples
+    --------
+    Set the option globally
+
+    >>> mpu.set_options(autodraw="never")  # doctest: +SKIP
+
+    or within a context manager
+
+    >>> with mpu.set_options(autodraw="never"):  # doctest: +SKIP
+    ...     f.savefig("figure.png")
+    """
+
+    def __init__(self, **kwargs):
+
+        self.old = {}
+        for key, value in kwargs.items():
+            if key not in OPTIONS:
+                raise ValueError(
+                    f"{key!r} is not in the set of valid options {set(OPTIONS)!r}"
+                )
+            if not _VALIDATORS[key](value):
+                raise ValueError(f"Invalid value for option {key!r}: {value!r}")
+
+            self.old[key] = OPTIONS[key]
+
+        OPTIONS.update(kwargs)
+
+    def __enter__(self):
+        return
+
+    def __exit__(self, type, value, traceback):
+        OPTIONS.update(self.old)
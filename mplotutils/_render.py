@@ -0,0 +1,121 @@
+import collections
+import io
+import os
+
+
+def render_many(
+    func,
+    items,
+    *,
+    fname=None,
+    max_workers=None,
+    max_tasks_per_child=None,
+    mp_context=None,
+    **kwargs,
+):
+    """render many figures in parallel in a pool of processes
+
+    Parameters
+    ----------
+    func : callable
+        Function creating one figure, called as ``func(item)``. Must return the
+        ``Figure``, which is saved and closed in the worker. Must be picklable, i.e.,
+        defined at the top level of a module.
+    items : iterable
+        Items to pass to ``func``, e.g. DataArrays or dicts with plotting options. Must
+        be picklable.
+    fname : str, optional
+        Format string of the file names, formatted with the index of the item, e.g.,
+        ``"map_{:03d}.png"``. If None, the figures are returned as bytes.
+    max_workers : int, optional
+        Number of worker processes. Defaults to the number of processors.
+    max_tasks_per_child : int, optional
+        Number of figures a worker renders before it is replaced by a new process.
+        Can be used to bound the memory of long running jobs. Must be None if
+        ``mp_context`` uses "fork".
+    mp_context : multiprocessing context, optional
+        Context used to start the workers, see ``concurrent.futures.ProcessPoolExecutor``.
+    **kwargs : keyword arguments
+        Passed to ``Figure.savefig``, e.g., ``dpi`` or ``format`` (defaults to
+        "png" if ``fname`` is None).
+
+    Returns
+    -------
+    results : list of str or bytes
+        File names or the content of the rendered figures, in the order of ``items``.
+
+    Notes
+    -----
+    The workers use the "Agg" backend and are reused for several figures, such that
+    modules (e.g. cartopy) are imported only once per worker. At most two items per
+    worker are submitted to the pool at any time to bound memory usage.
+
+    Examples
+    --------
+    >>> def plot(da):  # doctest: +SKIP
+    ...     f, ax = plt.subplots(subplot_kw={"projection": ccrs.Robinson()})
+    ...     h = da.plot(ax=ax, transform=ccrs.PlateCarree(), add_colorbar=False)
+    ...     mpu.colorbar(h, ax)
+    ...     return f
+
+    >>> mpu.render_many(plot, das, fname="map_{:03d}.png")  # doctest: +SKIP
+    """
+
+    # imports multiprocessing - only load it when required
+    from concurrent.futures import ProcessPoolExecutor
+
+    if fname is None:
+        kwargs.setdefault("format", "png")
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=_init_worker,
+        max_tasks_per_child=max_tasks_per_child,
+    ) as executor:
+
+        # limit the number of items pending in the pool
+        max_pending = 2 * max_workers
+
+        results = []
+        pending = collections.deque()
+        for index, item in enumerate(items):
+
+            if len(pending) >= max_pending:
+                results.append(pending.popleft().result())
+
+            future = executor.submit(_render_one, func, index, item, fname, kwargs)
+            pending.append(future)
+
+        results.extend(future.result() for future in pending)
+
+    return results
+
+
+def _init_worker():
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+
+def _render_one(func, index, item, fname, kwargs):
+
+    import matplotlib.pyplot as plt
+
+    fig = func(item)
+
+    try:
+        if fname is None:
+            buffer = io.BytesIO()
+            fig.savefig(buffer, **kwargs)
+            return buffer.getvalue()
+
+        fname = fname.format(index)
+        fig.savefig(fname, **kwargs)
+        return fname
+    finally:
+        plt.close(fig)
@@ -2,6 +2,8 @@ from functools import wraps
 
 from matplotlib.figure import Figure
 
+from mplotutils._options import OPTIONS
+
 # ensure the original implementation is not overwritten
 try:
     savefig_orig
@@ -14,14 +16,24 @@ def savefig(func):
     @wraps(func)
     def inner(self, *args, **kwargs):
 
-        # call draw in any case
-        self.canvas.draw()
+        if _needs_draw(self):
+            self.canvas.draw()
 
         return func(self, *args, **kwargs)
 
     return inner
 
 
+def _needs_draw(fig):
+
+    # colorbars added by mpu.colorbar are positioned within the draw, so figures
+    # containing them do not have to be drawn beforehand
+    if getattr(fig, "_mplotutils_layout", None) is not None:
+        return False
+
+    return OPTIONS["autodraw"] == "all"
+
+
 class autodraw:
 
     def __init__(self, /, toggle):
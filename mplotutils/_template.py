@@ -0,0 +1,129 @@
+import matplotlib as mpl
+import numpy as np
+
+from mplotutils._blit import BlitManager
+
+
+class FigureTemplate:
+    """reuse a figure for several frames, only swapping the data
+
+    Useful for animations or a series of maps where only the data changes: the
+    figure, GeoAxes, colorbar, tick labels, and figure size are created once and are
+    not recomputed when the data is updated.
+
+    Parameters
+    ----------
+    mappable : QuadMesh
+        Mesh whose data is updated, e.g., the handle returned by ``ax.pcolormesh`` or
+        ``da.plot.pcolormesh``.
+    hatches : iterable of QuadContourSet or PathCollection, optional
+        Artists returned by ``mpu.hatch``, ``mpu.hatch_map``, or
+        ``mpu.hatch_map_global`` which are updated for each frame.
+    blit : bool, default: False
+        If True, the static parts of the figure are cached and only the mesh and the
+        hatches are redrawn on ``update`` (see ``mpu.BlitManager``). Useful for
+        interactive figures.
+
+    Examples
+    --------
+    >>> import matplotlib.pyplot as plt
+    >>> import mplotutils as mpu
+
+    >>> f, ax = plt.subplots()
+    >>> h = ax.pcolormesh([[0, 1], [2, 3]], vmin=0, vmax=3)
+    >>> cbar = mpu.colorbar(h, ax)
+
+    >>> template = mpu.FigureTemplate(h)
+    >>> for i in range(3):
+    ...     template.update([[i, 1], [2, 3]])
+    ...     f.savefig(f"frame_{i}.png")  # doctest: +SKIP
+    """
+
+    def __init__(self, mappable, hatches=(), *, blit=False):
+
+        if not isinstance(mappable, mpl.collections.QuadMesh):
+            raise TypeError(
+                f"Expected a QuadMesh (e.g. from pcolormesh), got {type(mappable)}"
+            )
+
+        hatches = list(hatches)
+        for h in hatches:
+            if not hasattr(h, "_mplotutils_hatch"):
+                raise TypeError(
+                    "hatches must be created by an mplotutils hatch function"
+                )
+
+        self.mappable = mappable
+        self.hatches = hatches
+
+        self.blit_manager = None
+        if blit:
+            self.blit_manager = BlitManager(self.figure, [mappable, *hatches])
+
+    @property
+    def figure(self):
+        return self.mappable.axes.figure
+
+    def update(self, data=None, hatches=None):
+        """update the data of the mesh and the hatches
+
+        Parameters
+        ----------
+        data : array_like, optional
+            New data of the mesh, must have the same shape as the original data. The
+            normalization (i.e. the colorbar) is not changed.
+        hatches : iterable of xr.DataArray, optional
+            New boolean masks for the hatches, in the order they were passed to the
+            template.
+
+        Notes
+        -----
+        If the template was created with ``blit=True``, the figure is updated directly.
+        """
+
+        if data is not None:
+            data = np.asarray(data)
+            shape = self.mappable.get_array().shape
+
+            if data.shape != shape:
+                raise ValueError(
+                    f"Expected data with shape {shape}, got data with shape {data.shape}"
+                )
+
+            self.mappable.set_array(data)
+
+        if hatches is not None:
+            hatches = list(hatches)
+
+            if len(hatches) != len(self.hatches):
+                raise ValueError(
+                    f"Expected {len(self.hatches)} hatch mask(s), got {len(hatches)}"
+                )
+
+            self.hatches = [
+                _replace_hatch(old, mask) for old, mask in zip(self.hatches, hatches)
+            ]
+
+            if self.blit_manager is not None:
+                for h in self.hatches:
+                    self.blit_manager.add_artist(h)
+
+        if self.blit_manager is not None:
+            self.blit_manager.update()
+
+
+def _replace_hatch(old, mask):
+
+    from mplotutils._hatch import _hatch
+
+    ax = old.axes
+    kwargs = old._mplotutils_hatch
+
+    old.remove()
+
+    # the legend entries were already added - one None per pattern, because a single
+    # None uses the keys of a dict of masks as labels
+    hatch = kwargs["hatch"]
+    n_hatches = 1 if isinstance(hatch, str) else len(hatch)
+
+    return _hatch(mask, ax=ax, label=[None] * n_hatches, **kwargs)
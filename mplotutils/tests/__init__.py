@@ -34,6 +34,14 @@ def subplots_context(*args, **kwargs):
         plt.close(fig)
 
 
+def count_draw_events(fig):
+    """record the draw events of fig - the returned list grows with each draw"""
+
+    events = []
+    fig.canvas.mpl_connect("draw_event", events.append)
+    return events
+
+
 @contextlib.contextmanager
 def restore_backend(backend):
 
@@ -0,0 +1,126 @@
+import io
+
+import cartopy.crs as ccrs
+import numpy as np
+import pytest
+import xarray as xr
+
+import mplotutils as mpu
+
+from . import count_draw_events, subplots_context
+
+
+def _buffer(f):
+    return np.asarray(f.canvas.buffer_rgba()).copy()
+
+
+def test_blit_manager_wrong_figure():
+
+    with subplots_context() as (f1, ax1), subplots_context() as (f2, ax2):
+        h = ax2.pcolormesh([[0, 1]])
+
+        with pytest.raises(ValueError, match="must belong to the figure"):
+            mpu.BlitManager(f1, [h])
+
+
+def test_blit_manager_background_cached():
+
+    with subplots_context() as (f, ax):
+        h = ax.pcolormesh([[0, 1], [2, 3]], vmin=0, vmax=3)
+        mpu.colorbar(h, ax)
+        # the spines would be drawn above the mesh by a regular draw
+        ax.set_axis_off()
+
+        bm = mpu.BlitManager(f, [h])
+
+        events = count_draw_events(f)
+
+        for i in range(3):
+            h.set_array([[i, 1], [2, 3]])
+            bm.update()
+
+        # the background is only rendered once
+        assert len(events) == 1
+
+        # the same as drawing the full figure (nothing is drawn above the mesh)
+        result = _buffer(f)
+        f.canvas.draw()
+        np.testing.assert_equal(_buffer(f), result)
+
+        # changing the figure size re-renders the background
+        n_events = len(events)
+        f.set_size_inches(4, 4)
+        bm.update()
+        assert len(events) == n_events + 1
+
+        bm.remove()
+        assert bm.artists == []
+
+
+def test_blit_manager_draw_invalidates_background():
+
+    with subplots_context() as (f, ax):
+        h = ax.pcolormesh([[0, 1], [2, 3]])
+
+        bm = mpu.BlitManager(f, [h])
+        bm.update()
+
+        events = count_draw_events(f)
+        f.canvas.draw()
+
+        assert bm._background is None
+        bm.update()
+        assert len(events) == 2
+
+
+def test_figure_template_blit():
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(subplot_kw=subplot_kw) as (f, ax):
+        h = ax.pcolormesh([[0, 1], [2, 3]])
+
+        mask = xr.DataArray(
+            np.array([[1, 0], [0, 0]], dtype=bool),
+            dims=("lat", "lon"),
+            coords={"lat": [0, 1], "lon": [0, 1]},
+        )
+        hatch = mpu.hatch_map(mask, "//", ax=ax)
+
+        template = mpu.FigureTemplate(h, hatches=[hatch], blit=True)
+        events = count_draw_events(f)
+
+        template.update([[3, 2], [1, 0]], hatches=[~mask])
+        template.update([[0, 1], [2, 3]], hatches=[mask])
+
+        assert len(events) == 1
+
+        (new_hatch,) = template.hatches
+        assert not new_hatch.get_animated()
+        assert template.blit_manager.artists == [h, new_hatch]
+
+
+def test_blit_manager_savefig_keeps_zorder():
+
+    def _savefig(f):
+        buf = io.BytesIO()
+        f.savefig(buf, format="rgba")
+        return buf.getvalue()
+
+    def _plot(f, ax):
+        h = ax.pcolormesh([[0, 1], [2, 3]])
+        # static artist drawn above the mesh
+        ax.plot([0, 2], [0, 2], lw=10, color="w", zorder=3)
+        return h
+
+    with subplots_context() as (f, ax):
+        _plot(f, ax)
+        expected = _savefig(f)
+
+    with subplots_context() as (f, ax):
+        h = _plot(f, ax)
+
+        bm = mpu.BlitManager(f, [h])
+        bm.update()
+
+        assert not h.get_animated()
+        assert _savefig(f) == expected
@@ -1,3 +1,5 @@
+import pickle
+
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
@@ -5,7 +7,7 @@ import pytest
 import mplotutils as mpu
 from mplotutils._colorbar import _get_cbax, _parse_shift_shrink, _parse_size_aspect_pad
 
-from . import figure_context, subplots_context
+from . import count_draw_events, figure_context, subplots_context
 
 
 def assert_position(cbar, expected):
@@ -645,3 +647,203 @@ def test_get_cbax():
 
         _get_cbax(f)
         assert len(f.get_axes()) == 5
+
+
+def test_colorbar_defer():
+
+    with subplots_context() as (f, ax):
+        h = ax.pcolormesh([[0, 1]])
+
+        events = count_draw_events(f)
+        cbar = mpu.colorbar(h, ax, defer=True)
+
+        assert len(events) == 0
+
+        # the position is only updated on draw
+        assert cbar.ax.get_position().x0 == 0
+
+        f.canvas.draw()
+        assert cbar.ax.get_position().x0 > ax.get_position().x1
+
+
+def test_batch_layout():
+
+    with subplots_context(3, 1) as (f, axs):
+
+        events = count_draw_events(f)
+
+        with mpu.batch_layout(f):
+            cbars = [mpu.colorbar(ax.pcolormesh([[0, 1]]), ax) for ax in axs]
+
+            assert len(events) == 0
+
+            with mpu.batch_layout(f):
+                mpu.colorbar(axs[0].pcolormesh([[0, 1]]), axs[0])
+
+            # no update when exiting a nested context
+            assert cbars[0].ax.get_position().x0 == 0
+
+        # the figure is not drawn
+        assert len(events) == 0
+
+        for ax, cbar in zip(axs, cbars):
+            pos = ax.get_position()
+            expected = [pos.x1 + 0.05 * pos.width, pos.y0]
+            result = [cbar.ax.get_position().x0, cbar.ax.get_position().y0]
+            np.testing.assert_allclose(result, expected)
+
+
+def test_batch_layout_error():
+
+    with subplots_context() as (f, ax):
+
+        events = count_draw_events(f)
+
+        with pytest.raises(RuntimeError, match="error"):
+            with mpu.batch_layout(f):
+                raise RuntimeError("error")
+
+        assert len(events) == 0
+        assert f._mplotutils_batch_layout == 0
+
+
+def _n_draw_callbacks(f):
+    return len(f._canvas_callbacks.callbacks.get("draw_event", {}))
+
+
+def test_colorbar_layout_no_draw_callback():
+
+    with subplots_context(2, 1) as (f, axs):
+
+        n_callbacks = _n_draw_callbacks(f)
+
+        for _ in range(5):
+            mpu.colorbar(axs[0].pcolormesh([[0, 1]]), axs)
+
+        assert _n_draw_callbacks(f) == n_callbacks
+        assert len(f._mplotutils_layout.resizers) == 5
+
+
+def test_colorbar_layout_parent_position_computed_once(monkeypatch):
+
+    with subplots_context() as (f, ax):
+
+        for _ in range(3):
+            mpu.colorbar(ax.pcolormesh([[0, 1]]), ax)
+
+        n_calls = []
+        get_position = ax.get_position
+
+        def counting_get_position(original=False):
+            # apply_aspect internally calls get_position(original=True)
+            if not original:
+                n_calls.append(1)
+            return get_position(original=original)
+
+        monkeypatch.setattr(ax, "get_position", counting_get_position)
+
+        f._mplotutils_layout.update()
+
+        assert len(n_calls) == 1
+
+
+def test_colorbar_layout_removed_colorbar():
+
+    with subplots_context() as (f, ax):
+
+        cbar1 = mpu.colorbar(ax.pcolormesh([[0, 1]]), ax)
+        cbar2 = mpu.colorbar(ax.pcolormesh([[0, 1]]), ax)
+
+        cbar1.remove()
+        f._mplotutils_layout.update()
+
+        resizers = f._mplotutils_layout.resizers
+        assert len(resizers) == 1
+        assert resizers[0].cbax is cbar2.ax
+
+
+def test_colorbar_layout_remove():
+
+    with subplots_context() as (f, ax):
+
+        n_callbacks = _n_draw_callbacks(f)
+
+        cbar = mpu.colorbar(ax.pcolormesh([[0, 1]]), ax)
+        layout = f._mplotutils_layout
+
+        layout.remove()
+
+        assert _n_draw_callbacks(f) == n_callbacks
+        assert not hasattr(f, "_mplotutils_layout")
+
+        # the colorbar is no longer resized
+        pos = cbar.ax.get_position().bounds
+        ax.set_aspect(0.5)
+        f.canvas.draw()
+        np.testing.assert_allclose(cbar.ax.get_position().bounds, pos)
+
+
+def test_colorbar_positioned_without_draw():
+
+    with subplots_context() as (f, ax):
+        h = ax.pcolormesh([[0, 1]])
+        ax.set_aspect(0.5)
+
+        events = count_draw_events(f)
+        cbar = mpu.colorbar(h, ax)
+
+        assert len(events) == 0
+        assert cbar.ax.get_axes_locator() is not None
+
+        pos = ax.get_position()
+        expected = [pos.x1 + 0.05 * pos.width, pos.y0, pos.height]
+        cbpos = cbar.ax.get_position()
+        np.testing.assert_allclose([cbpos.x0, cbpos.y0, cbpos.height], expected)
+
+
+def test_colorbar_positioned_without_draw_axes_grid():
+
+    from mpl_toolkits.axes_grid1 import AxesGrid
+
+    with figure_context() as f:
+        axgr = AxesGrid(f, 111, nrows_ncols=(2, 1), axes_pad=0.5)
+        h = axgr[0].pcolormesh([[0, 1]])
+
+        cbar = mpu.colorbar(h, axgr[1])
+        result = cbar.ax.get_position().bounds
+
+        f.canvas.draw()
+        np.testing.assert_allclose(result, cbar.ax.get_position().bounds)
+
+
+@pytest.mark.parametrize("orientation", ("vertical", "horizontal"))
+@pytest.mark.parametrize("size", (None, 0.05))
+def test_colorbar_pickle(orientation, size):
+
+    with subplots_context(2, 1) as (f, axs):
+        h = axs[0].pcolormesh([[0, 1]])
+        cbar = mpu.colorbar(h, axs, orientation=orientation, size=size, shrink=0.2)
+
+        f.canvas.draw()
+        expected = cbar.ax.get_position().bounds
+
+        f_unpickled = pickle.loads(pickle.dumps(f))
+
+        try:
+            (resizer,) = f_unpickled._mplotutils_layout.resizers
+            cbax = resizer.cbax
+
+            assert cbax in f_unpickled.axes
+            assert cbax.get_axes_locator() is resizer
+
+            f_unpickled.canvas.draw()
+            np.testing.assert_allclose(cbax.get_position().bounds, expected)
+
+            # the colorbar is still resized after unpickling
+            f_unpickled.axes[0].set_aspect(0.5)
+            f_unpickled.canvas.draw()
+
+            pos = cbax.get_position()
+            assert not np.allclose(pos.bounds, expected)
+        finally:
+            plt.close(f_unpickled)
@@ -1,3 +1,6 @@
+import tracemalloc
+
+import numpy as np
 import pytest
 import xarray as xr
 
@@ -51,3 +54,45 @@ def test_cyclic_dataarray(as_dataset):
 
     result = cyclic_dataarray(data)
     xr.testing.assert_identical(result, expected)
+
+
+def test_cyclic_dataarray_peak_memory():
+    # the data is copied only once (pad) - the peak memory is roughly the result
+
+    data = np.random.default_rng(0).random((20, 90, 180))
+    lon = np.arange(0, 360, 2.0)
+    da = xr.DataArray(data, dims=("time", "lat", "lon"), coords={"lon": lon})
+
+    # warm up (imports, caches)
+    cyclic_dataarray(da)
+
+    tracemalloc.start()
+    try:
+        result = cyclic_dataarray(da)
+        __, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert peak < 1.2 * result.nbytes
+
+
+@pytest.mark.parametrize("as_dataset", (True, False))
+def test_cyclic_dataarray_dask(as_dataset):
+    dask = pytest.importorskip("dask")
+
+    lon = np.arange(0, 360, 30.0)
+    da = xr.DataArray(np.arange(48.0).reshape(4, 12), dims=("y", "lon"), name="data")
+    da = da.assign_coords(lon=lon).chunk(y=2, lon=4)
+    data = da.to_dataset() if as_dataset else da
+
+    def raise_if_computed(*args, **kwargs):
+        raise AssertionError("The data should not be computed")
+
+    with dask.config.set(scheduler=raise_if_computed):
+        result = cyclic_dataarray(data)
+
+    result = result if not as_dataset else result["data"]
+    assert result.chunks == ((2, 2), (4, 4, 4, 1))
+
+    expected = cyclic_dataarray(da.compute())
+    xr.testing.assert_identical(result.compute(), expected)
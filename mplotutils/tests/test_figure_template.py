@@ -0,0 +1,102 @@
+import cartopy.crs as ccrs
+import numpy as np
+import pytest
+import xarray as xr
+
+import mplotutils as mpu
+
+from . import subplots_context
+
+
+def _mask(values):
+    return xr.DataArray(
+        np.array(values, dtype=bool),
+        dims=("lat", "lon"),
+        coords={"lat": [0, 1], "lon": [0, 1]},
+    )
+
+
+def test_figure_template_wrong_mappable():
+
+    with subplots_context() as (f, ax):
+        h = ax.contourf([[0, 1], [2, 3]])
+
+        with pytest.raises(TypeError, match="Expected a QuadMesh"):
+            mpu.FigureTemplate(h)
+
+        h = ax.pcolormesh([[0, 1], [2, 3]])
+        with pytest.raises(TypeError, match="must be created by an mplotutils hatch"):
+            mpu.FigureTemplate(h, hatches=[ax.contourf([[0, 1], [2, 3]])])
+
+
+def test_figure_template_update_data():
+
+    with subplots_context() as (f, ax):
+        h = ax.pcolormesh([[0, 1], [2, 3]], vmin=0, vmax=3)
+        cbar = mpu.colorbar(h, ax)
+
+        f.canvas.draw()
+        cbar_pos = cbar.ax.get_position().bounds
+
+        template = mpu.FigureTemplate(h)
+        assert template.figure is f
+
+        template.update([[3, 2], [1, 0]])
+
+        np.testing.assert_equal(h.get_array(), [[3, 2], [1, 0]])
+        # the normalization is not changed
+        assert h.norm.vmin == 0
+        assert h.norm.vmax == 3
+
+        f.canvas.draw()
+        assert cbar.ax.get_position().bounds == cbar_pos
+
+        with pytest.raises(ValueError, match=r"Expected data with shape \(2, 2\)"):
+            template.update([0, 1])
+
+
+@pytest.mark.parametrize("function", (mpu.hatch_map, mpu.hatch_map_global))
+def test_figure_template_update_hatches(function):
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(subplot_kw=subplot_kw) as (f, ax):
+        h = ax.pcolormesh([[0, 1], [2, 3]])
+
+        hatch = function(_mask([[1, 0], [0, 0]]), "//", ax=ax, label="label")
+        n_artists = len(ax.get_children())
+
+        template = mpu.FigureTemplate(h, hatches=[hatch])
+        template.update(hatches=[_mask([[0, 1], [1, 1]])])
+
+        (new,) = template.hatches
+        assert new is not hatch
+        assert new.hatches == ["", "//"]
+        assert hatch not in ax.get_children()
+
+        # no additional legend patch
+        assert len(ax.get_children()) == n_artists
+
+        with pytest.raises(ValueError, match=r"Expected 1 hatch mask\(s\), got 2"):
+            template.update(hatches=[_mask([[0, 1], [1, 1]])] * 2)
+
+
+def test_figure_template_update_hatches_dict():
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(subplot_kw=subplot_kw) as (f, ax):
+        h = ax.pcolormesh([[0, 1], [2, 3]])
+
+        masks = {"a": _mask([[1, 0], [0, 0]]), "b": _mask([[0, 1], [0, 0]])}
+        hatch = mpu.hatch_map(masks, ["//", ".."], ax=ax)
+
+        template = mpu.FigureTemplate(h, hatches=[hatch])
+
+        for __ in range(3):
+            template.update(hatches=[masks])
+
+        (new,) = template.hatches
+        assert new.hatches == ["", "//", ".."]
+
+        # no additional legend patches
+        labels = [handle.get_label() for handle in ax.legend().legend_handles]
+        assert labels == ["a", "b"]
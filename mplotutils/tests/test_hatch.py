@@ -2,6 +2,7 @@ import cartopy.crs as ccrs
 import matplotlib as mpl
 import numpy as np
 import pytest
+import shapely
 import xarray as xr
 from packaging.version import Version
 
@@ -117,6 +118,29 @@ def test_hatch_label(function):
             assert mpl.colors.to_rgba("#2ca25f") == get_hatchcolor(rect)
 
 
+@requires_mpl_ge_310
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS)
+def test_hatch_label_linewidth(function):
+
+    da = xr.DataArray(
+        np.ones([3, 3], dtype=bool),
+        dims=("lat", "lon"),
+        coords={"lat": [0, 1, 2], "lon": [1, 2, 3]},
+    )
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
+
+        function(da, "*", ax=ax, label="label0")
+        function(da, "*", ax=ax, label="label1", linewidth=2)
+
+        h0, h1 = ax.legend().legend_handles
+
+        assert h0.get_hatch_linewidth() == 0.25
+        assert h1.get_hatch_linewidth() == 2
+
+
 @pytest.mark.skipif(MPL_GE_310, reason="only for mpl < 3.10")
 @pytest.mark.parametrize("function", HATCH_FUNCTIONS)
 def test_hatch_linewidth_mpl_lt_310(function):
@@ -171,41 +195,44 @@ def test_hatch_linewidth_mpl_ge_310(function):
 
     subplot_kw = {"projection": ccrs.PlateCarree()}
 
+    # the linewidth is set per artist and the rcParams are not changed
+    rc_linewidth = mpl.rcParams["hatch.linewidth"]
+
     # test linewidth default width
     with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
         q = function(da, "*", ax=ax)
         assert q.get_hatch_linewidth() == 0.25
-        assert mpl.rcParams["hatch.linewidth"] == 0.25
+        assert mpl.rcParams["hatch.linewidth"] == rc_linewidth
 
     # changing away from the default linewidth does not raise a warning
     with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
 
         q = function(da, "*", ax=ax)
         assert q.get_hatch_linewidth() == 0.25
-        assert mpl.rcParams["hatch.linewidth"] == 0.25
+        assert mpl.rcParams["hatch.linewidth"] == rc_linewidth
 
         with assert_no_warnings():
             q = function(da, "*", ax=ax, linewidth=1)
 
         assert q.get_hatch_linewidth() == 1
-        assert mpl.rcParams["hatch.linewidth"] == 1
+        assert mpl.rcParams["hatch.linewidth"] == rc_linewidth
 
         q = function(da, "*", ax=ax)
         assert q.get_hatch_linewidth() == 0.25
-        assert mpl.rcParams["hatch.linewidth"] == 0.25
+        assert mpl.rcParams["hatch.linewidth"] == rc_linewidth
 
     # changing away from the linewidth does NOT raise a warning
     with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
 
         q = function(da, "*", ax=ax, linewidth=2)
         assert q.get_hatch_linewidth() == 2
-        assert mpl.rcParams["hatch.linewidth"] == 2
+        assert mpl.rcParams["hatch.linewidth"] == rc_linewidth
 
         with assert_no_warnings():
             q = function(da, "*", ax=ax, linewidth=1)
 
         assert q.get_hatch_linewidth() == 1
-        assert mpl.rcParams["hatch.linewidth"] == 1
+        assert mpl.rcParams["hatch.linewidth"] == rc_linewidth
 
 
 @pytest.mark.parametrize("function", HATCH_FUNCTIONS)
@@ -277,3 +304,494 @@ def test_hatch_bbox():
         assert bbox.x1 == 4  # this is 4 because it's wrapped around
         assert bbox.y0 == 0
         assert bbox.y1 == 2
+
+
+def _large_mask(n_lat=360, n_lon=720):
+
+    lat = np.linspace(-89.75, 89.75, n_lat)
+    lon = np.linspace(-179.75, 179.75, n_lon)
+    data = np.zeros((n_lat, n_lon), dtype=bool)
+    data[: n_lat // 2, : n_lon // 2] = True
+
+    return xr.DataArray(data, dims=("lat", "lon"), coords={"lat": lat, "lon": lon})
+
+
+def test_coarsen_to_axes():
+
+    from mplotutils._hatch import _coarsen_to_axes
+
+    da = _large_mask()
+
+    with subplots_context(1, 1, figsize=(2, 1), dpi=50) as (__, ax):
+        # the axes is about 77 x 38 pixels
+        result = _coarsen_to_axes(da, ax)
+
+        assert result.dtype == bool
+        assert result.sizes == {"lat": 90, "lon": 180}
+
+        # coords stay equally spaced
+        np.testing.assert_allclose(np.diff(result.lon), 2.0)
+        np.testing.assert_allclose(result.lon[0], -179.0)
+
+        # the blocks are either fully hatched or not at all
+        assert result.isel(lat=slice(None, 45), lon=slice(None, 90)).all()
+        assert not result.isel(lat=slice(45, None)).any()
+
+
+def test_coarsen_to_axes_small_mask_unchanged():
+
+    from mplotutils._hatch import _coarsen_to_axes
+
+    da = _large_mask(18, 36)
+
+    with subplots_context(1, 1) as (__, ax):
+        result = _coarsen_to_axes(da, ax)
+
+    assert result is da
+
+
+def test_coarsen_to_axes_regional():
+
+    from mplotutils._hatch import _coarsen_to_axes
+
+    # 0.1° global mask
+    da = _large_mask(1800, 3600)
+    transform = ccrs.PlateCarree()
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(1, 1, subplot_kw=subplot_kw, dpi=50) as (__, ax):
+        ax.set_extent((0, 20, 0, 20), crs=transform)
+
+        # 200 x 200 cells are visible - fewer than two per pixel
+        result = _coarsen_to_axes(da, ax, transform)
+
+        assert result is da
+
+        ax.set_global()
+
+        # the full mask is visible
+        result = _coarsen_to_axes(da, ax, transform)
+        assert result.sizes["lon"] < da.sizes["lon"]
+
+
+def test_coarsen_to_axes_xlim():
+
+    from mplotutils._hatch import _coarsen_to_axes
+
+    da = _large_mask()
+
+    with subplots_context(1, 1, figsize=(2, 1), dpi=50) as (__, ax):
+        ax.set_xlim(0, 20)
+        ax.set_ylim(0, 20)
+
+        result = _coarsen_to_axes(da, ax)
+
+    assert result is da
+
+
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS)
+def test_hatch_coarsen_dask(function):
+    dask = pytest.importorskip("dask")
+
+    da = _large_mask().chunk(lat=90)
+
+    n_computed_elements = 0
+
+    def callback(key, result, dsk, state, worker_id):
+        nonlocal n_computed_elements
+        n_computed_elements = max(n_computed_elements, np.size(result))
+
+    kwargs = {"subplot_kw": {"projection": ccrs.PlateCarree()}, "dpi": 50}
+    with subplots_context(1, 1, figsize=(2, 1), **kwargs) as (__, ax):
+        with dask.callbacks.Callback(posttask=callback):
+            h = function(da, "*", ax=ax)
+
+    assert h.hatches == ["", "*"]
+    # only the chunks are loaded, never the full mask
+    assert 0 < n_computed_elements < da.size
+
+
+@pytest.mark.parametrize("coarsen", (True, False))
+def test_hatch_coarsen_option(coarsen):
+
+    da = _large_mask()
+
+    with subplots_context(1, 1, figsize=(2, 1), dpi=50) as (__, ax):
+        h = mpu.hatch(da, "*", ax=ax, coarsen=coarsen)
+
+    bbox = h.get_datalim(ax.transData)
+    expected = -179.0 if coarsen else -179.75
+    np.testing.assert_allclose(bbox.x0, expected)
+
+
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS)
+def test_hatch_engine_wrong(function):
+
+    da = xr.DataArray(np.ones([3, 3], dtype=bool))
+
+    with pytest.raises(ValueError, match="engine must be one of"):
+        function(da, "*", engine="foo")
+
+
+@pytest.mark.parametrize("p", (0.1, 0.5, 0.9))
+def test_mask_to_rectangles(p):
+
+    from mplotutils._hatch import _mask_to_rectangles
+
+    mask = np.random.default_rng(0).random((30, 40)) < p
+
+    rectangles = _mask_to_rectangles(mask)
+
+    # the rectangles cover exactly the True cells and do not overlap
+    result = np.zeros(mask.shape, dtype=int)
+    for row0, row1, col0, col1 in rectangles:
+        result[row0:row1, col0:col1] += 1
+
+    np.testing.assert_array_equal(result, mask)
+
+
+def test_mask_to_rectangles_merged():
+
+    from mplotutils._hatch import _mask_to_rectangles
+
+    mask = np.zeros((5, 6), dtype=bool)
+    mask[1:4, 1:5] = True
+
+    np.testing.assert_array_equal(_mask_to_rectangles(mask), [[1, 4, 1, 5]])
+
+    mask = np.zeros((5, 6), dtype=bool)
+    np.testing.assert_array_equal(_mask_to_rectangles(mask), np.empty((0, 4)))
+
+
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS)
+def test_hatch_engine_cells(function):
+
+    da = xr.DataArray(
+        [[True, True, False], [True, True, False], [False, False, False]],
+        dims=("lat", "lon"),
+        coords={"lat": [0, 1, 2], "lon": [1, 2, 3]},
+    )
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
+        h = function(da, "*", ax=ax, engine="cells")
+
+        assert isinstance(h, mpl.collections.PathCollection)
+        assert h.get_hatch() == "*"
+        assert h in ax.collections
+
+        (path,) = h.get_paths()
+
+        # one rectangle bounded by the cell edges (also for hatch_map_global)
+        expected = [[0.5, -0.5], [2.5, -0.5], [2.5, 1.5], [0.5, 1.5], [0.5, -0.5]]
+        np.testing.assert_allclose(path.vertices, expected)
+
+
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS)
+def test_hatch_engine_cells_list_of_one_hatch(function):
+
+    da = xr.DataArray(
+        [[True, False], [False, False]],
+        dims=("lat", "lon"),
+        coords={"lat": [0, 1], "lon": [1, 2]},
+    )
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (f, ax):
+        h = function(da, ["/"], ax=ax, engine="cells")
+
+        assert h.get_hatch() == "/"
+        f.canvas.draw()
+
+
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS)
+def test_hatch_simplify_requires_cells(function):
+
+    da = xr.DataArray(np.ones([3, 3], dtype=bool))
+
+    with pytest.raises(ValueError, match="simplify is only supported"):
+        function(da, "*", simplify=0.5)
+
+
+def _signed_areas(path):
+
+    areas = []
+    for x, y in (p.T for p in path.to_polygons()):
+        areas.append(0.5 * np.sum(x[:-1] * y[1:] - x[1:] * y[:-1]))
+
+    return areas
+
+
+def _ring_mask():
+    # a square with a hole in the middle
+    data = np.zeros((7, 7), dtype=bool)
+    data[1:6, 1:6] = True
+    data[3, 3] = False
+
+    coords = {"lat": np.arange(7.0), "lon": np.arange(7.0)}
+    return xr.DataArray(data, dims=("lat", "lon"), coords=coords)
+
+
+def test_hatch_simplify_merges_cells():
+
+    da = _ring_mask()
+
+    with subplots_context(1, 1) as (__, ax):
+        h = mpu.hatch(da, "*", ax=ax, engine="cells", simplify=0)
+
+        (path,) = h.get_paths()
+
+        # the exterior and the hole (instead of 4 rectangles)
+        assert (path.codes == mpl.path.Path.MOVETO).sum() == 2
+        assert h.get_transform() == ax.transData
+
+        # the hole is oriented opposite to the exterior, so it is not hatched
+        exterior, hole = _signed_areas(path)
+        assert exterior == 25
+        assert hole == -1
+
+
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS[1:])
+def test_hatch_simplify_map_projected(function):
+
+    da = _ring_mask()
+
+    subplot_kw = {"projection": ccrs.Robinson()}
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
+        h = function(da, "*", ax=ax, engine="cells", simplify=0.5)
+
+        (path,) = h.get_paths()
+
+        # the path is projected when the hatch is created
+        assert h.get_transform() == ax.transData
+
+        # the hole is oriented opposite to the exterior, so it is not hatched
+        exterior, hole = _signed_areas(path)
+        assert exterior > 0
+        assert hole < 0
+
+        # projected coordinates
+        assert path.vertices.max() > 1e5
+
+
+def test_hatch_simplify_reduces_vertices():
+
+    lat = np.linspace(-89.5, 89.5, 180)
+    lon = np.linspace(-179.5, 179.5, 360)
+    y, x = np.meshgrid(np.deg2rad(lat), np.deg2rad(lon), indexing="ij")
+    data = np.sin(3 * x) * np.cos(4 * y) > 0.3
+    da = xr.DataArray(data, dims=("lat", "lon"), coords={"lat": lat, "lon": lon})
+
+    with subplots_context(1, 1) as (__, ax):
+        (merged,) = mpu.hatch(da, "*", ax=ax, engine="cells", simplify=0).get_paths()
+        (simple,) = mpu.hatch(da, "*", ax=ax, engine="cells", simplify=1).get_paths()
+
+    assert len(simple.vertices) < len(merged.vertices)
+
+
+def test_hatch_simplify_empty():
+
+    da = xr.DataArray(np.zeros([3, 3], dtype=bool), dims=("lat", "lon"))
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
+        h = mpu.hatch_map(da, "*", ax=ax, engine="cells", simplify=1)
+
+        (path,) = h.get_paths()
+        assert len(path.vertices) == 0
+
+
+def test_hatch_simplify_not_visible():
+
+    # the mask only covers the far side of the globe
+    da = xr.DataArray(
+        [[True, False], [False, False]],
+        dims=("lat", "lon"),
+        coords={"lat": [0, 10], "lon": [170, 180]},
+    )
+
+    subplot_kw = {"projection": ccrs.Orthographic(0, 0)}
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (f, ax):
+        h = mpu.hatch_map(da, "*", ax=ax, engine="cells", simplify=1)
+
+        (path,) = h.get_paths()
+        assert len(path.vertices) == 0
+
+        f.canvas.draw()
+
+
+def test_polygons_to_path_empty():
+
+    from mplotutils._hatch import _polygons_to_path
+
+    path = _polygons_to_path(shapely.Polygon())
+
+    assert len(path.vertices) == 0
+
+
+@requires_mpl_ge_310
+@pytest.mark.parametrize("engine", ("contourf", "cells"))
+def test_hatch_rcparams_unchanged(engine):
+
+    da = xr.DataArray(np.ones([3, 3], dtype=bool), dims=("lat", "lon"))
+
+    with mpl.rc_context({"hatch.linewidth": 0.75, "hatch.color": "red"}):
+        with subplots_context(1, 1) as (__, ax):
+            h = mpu.hatch(da, "*", ax=ax, color="blue", linewidth=2, engine=engine)
+
+            assert h.get_hatch_linewidth() == 2
+            assert get_hatchcolor(h) == mpl.colors.to_rgba("blue")
+
+        assert mpl.rcParams["hatch.linewidth"] == 0.75
+        assert mpl.rcParams["hatch.color"] == "red"
+
+
+@requires_mpl_ge_310
+def test_hatch_threads():
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    da = xr.DataArray(np.ones([3, 3], dtype=bool), dims=("lat", "lon"))
+    styles = [(f"C{i}", i + 1) for i in range(10)] * 5
+
+    def hatch(style):
+        color, linewidth = style
+        fig = mpl.figure.Figure()
+        ax = fig.add_subplot()
+        h = mpu.hatch(da, "*", ax=ax, color=color, linewidth=linewidth)
+        return get_hatchcolor(h), h.get_hatch_linewidth()
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(hatch, styles))
+
+    expected = [(mpl.colors.to_rgba(color), lw) for color, lw in styles]
+    assert results == expected
+
+
+@pytest.mark.parametrize(
+    "mpl_ge_310", (pytest.param(True, marks=requires_mpl_ge_310), False)
+)
+def test_hatch_figure_garbage_collected(monkeypatch, mpl_ge_310):
+
+    import gc
+    import weakref
+
+    from mplotutils import _hatch
+
+    # also check the code path for mpl < 3.10 (which keeps track of the figures)
+    monkeypatch.setattr(_hatch, "MPL_GE_310", mpl_ge_310)
+
+    da = xr.DataArray(np.ones([3, 3], dtype=bool), dims=("lat", "lon"))
+
+    with mpl.rc_context(), subplots_context() as (fig, ax):
+        mpu.hatch(da, "*", ax=ax, linewidth=1)
+
+        if not mpl_ge_310:
+            assert fig in _hatch._HATCHES_PER_FIGURE
+
+        ref = weakref.ref(fig)
+
+    del fig, ax
+    gc.collect()
+
+    assert ref() is None
+    assert len(_hatch._HATCHES_PER_FIGURE) == 0
+
+
+def _masks():
+
+    coords = {"lat": [0, 1, 2], "lon": [1, 2, 3]}
+    data = [[True, False, False], [True, False, False], [False, False, False]]
+    a = xr.DataArray(data, dims=("lat", "lon"), coords=coords)
+    b = xr.DataArray(np.roll(data, 1, axis=1), dims=("lat", "lon"), coords=coords)
+    c = xr.DataArray(np.roll(data, 2, axis=1), dims=("lat", "lon"), coords=coords)
+
+    return {"a": a, "b": b, "c": c}
+
+
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS)
+def test_hatch_multi_level_dict(function):
+
+    masks = _masks()
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
+        h = function(masks, ["//", "..", "xx"], ax=ax)
+
+        assert isinstance(h, mpl.contour.QuadContourSet)
+        assert h.hatches == ["", "//", "..", "xx"]
+        np.testing.assert_allclose(h.levels, [-0.5, 0.5, 1.5, 2.5, 3.5])
+
+        # the keys of the dict are used as labels
+        legend = ax.legend()
+        labels = [rect.get_label() for rect in legend.legend_handles]
+        assert labels == ["a", "b", "c"]
+
+        hatches = [rect.get_hatch() for rect in legend.legend_handles]
+        assert hatches == ["//", "..", "xx"]
+
+
+@pytest.mark.parametrize("function", HATCH_FUNCTIONS)
+def test_hatch_multi_level_categories(function):
+
+    masks = _masks()
+    categories = sum(i * mask for i, mask in enumerate(masks.values(), start=1))
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
+        expected = function(masks, ["//", "..", "xx"], ax=ax, label=[None] * 3)
+        h = function(categories, ["//", "..", "xx"], ax=ax)
+
+        assert h.hatches == ["", "//", "..", "xx"]
+        for path, path_expected in zip(h.get_paths(), expected.get_paths()):
+            np.testing.assert_allclose(path.vertices, path_expected.vertices)
+
+        # no labels are added per default
+        assert len(ax.get_legend_handles_labels()[0]) == 0
+
+
+def test_hatch_multi_level_cyclic_once(monkeypatch):
+
+    n_calls = 0
+    cyclic_dataarray = mpu.cyclic_dataarray
+
+    def counting(*args, **kwargs):
+        nonlocal n_calls
+        n_calls += 1
+        return cyclic_dataarray(*args, **kwargs)
+
+    monkeypatch.setattr(mpu, "cyclic_dataarray", counting)
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(1, 1, subplot_kw=subplot_kw) as (__, ax):
+        mpu.hatch_map_global(_masks(), ["//", "..", "xx"], ax=ax)
+
+    assert n_calls == 1
+
+
+def test_hatch_multi_level_errors():
+
+    masks = _masks()
+    categories = sum(i * mask for i, mask in enumerate(masks.values(), start=1))
+
+    with subplots_context(1, 1) as (__, ax):
+
+        with pytest.raises(ValueError, match="Expected one hatch pattern per mask"):
+            mpu.hatch(masks, ["//", ".."], ax=ax)
+
+        with pytest.raises(ValueError, match="Expected one hatch pattern per mask"):
+            mpu.hatch(masks, "//", ax=ax)
+
+        with pytest.raises(ValueError, match="Expected one label per hatch pattern"):
+            mpu.hatch(categories, ["//", "..", "xx"], ax=ax, label="label")
+
+        with pytest.raises(TypeError, match="Expected a boolean or integer array"):
+            mpu.hatch(categories.astype(float), ["//", "..", "xx"], ax=ax)
+
+        with pytest.raises(TypeError, match="Expected a boolean array"):
+            mpu.hatch({"a": categories}, ["//"], ax=ax)
+
+        with pytest.raises(ValueError, match="Several hatch patterns are only"):
+            mpu.hatch(masks, ["//", "..", "xx"], ax=ax, engine="cells")
@@ -0,0 +1,77 @@
+import cartopy.crs as ccrs
+import pytest
+
+import mplotutils as mpu
+from mplotutils._mpl import _layout_draw
+
+from . import subplots_context
+
+
+class CanvasDrawCalled(Exception):
+    pass
+
+
+def _raise(*args, **kwargs):
+    raise CanvasDrawCalled()
+
+
+def test_layout_draw_does_not_render(monkeypatch):
+
+    with subplots_context() as (f, ax):
+        ax.pcolormesh([[0, 1]])
+
+        renderer = f.canvas.get_renderer()
+        monkeypatch.setattr(renderer, "draw_path", _raise)
+        monkeypatch.setattr(renderer, "draw_path_collection", _raise)
+        monkeypatch.setattr(renderer, "draw_quad_mesh", _raise)
+
+        _layout_draw(f)
+
+        with pytest.raises(CanvasDrawCalled):
+            f.canvas.draw()
+
+
+def test_layout_draw_triggers_draw_event():
+
+    with subplots_context() as (f, ax):
+
+        events = []
+        f.canvas.mpl_connect("draw_event", events.append)
+
+        _layout_draw(f)
+
+        assert len(events) == 1
+
+
+def test_layout_draw_geoaxes():
+
+    subplot_kw = {"projection": ccrs.Robinson()}
+    with subplots_context(subplot_kw=subplot_kw) as (f, ax):
+        ax.set_global()
+
+        _layout_draw(f)
+
+        # the path of the map boundary is only computed on draw
+        assert len(ax.spines["geo"].get_path().vertices) > 0
+
+
+@pytest.mark.parametrize(
+    "func",
+    (
+        lambda ax, h: mpu.colorbar(h, ax),
+        lambda ax, h: mpu.set_map_layout(ax),
+        lambda ax, h: mpu.xticklabels([0, 90], ax=ax),
+        lambda ax, h: mpu.yticklabels([0, 45], ax=ax),
+    ),
+    ids=("colorbar", "set_map_layout", "xticklabels", "yticklabels"),
+)
+def test_no_canvas_draw(monkeypatch, func):
+
+    subplot_kw = {"projection": ccrs.PlateCarree()}
+    with subplots_context(subplot_kw=subplot_kw) as (f, ax):
+        ax.set_global()
+        h = ax.pcolormesh([[0, 1]])
+
+        monkeypatch.setattr(f.canvas, "draw", _raise)
+
+        func(ax, h)
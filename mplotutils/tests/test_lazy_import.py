@@ -0,0 +1,85 @@
+import subprocess
+import sys
+
+import pytest
+
+import mplotutils as mpu
+
+# these are only imported when the functions needing them are accessed (or called)
+HEAVY_MODULES = (
+    "cartopy",
+    "shapely",
+    "xarray",
+    "mpl_toolkits.axes_grid1",
+    "concurrent.futures.process",
+)
+
+# matplotlib is imported beforehand, this is the budget for mplotutils itself
+IMPORT_TIME_BUDGET = 0.5
+
+
+def _run(code):
+
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_heavy_modules():
+
+    code = (
+        "import sys; import mplotutils; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+
+    assert _run(code) == ""
+
+
+@pytest.mark.parametrize(
+    "attr, module",
+    (
+        ("colorbar", None),
+        ("from_levels_and_cmap", None),
+        ("xticklabels", "cartopy"),
+        ("hatch", "xarray"),
+        ("set_map_layout", "mpl_toolkits.axes_grid1"),
+    ),
+)
+def test_heavy_module_loaded_on_access(attr, module):
+
+    code = (
+        "import sys; import mplotutils; "
+        f"mplotutils.{attr}; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+
+    loaded = _run(code)
+
+    if module is None:
+        assert loaded == ""
+    else:
+        assert module in loaded.split(",")
+
+
+def test_import_time_budget():
+
+    code = (
+        "import time; import matplotlib.pyplot; "
+        "start = time.perf_counter(); import mplotutils; "
+        "print(time.perf_counter() - start)"
+    )
+
+    # take the fastest of a few runs to reduce noise
+    elapsed = min(float(_run(code)) for _ in range(3))
+
+    assert elapsed < IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize(
+    "attr", ("xticklabels", "hatch_map", "set_map_layout", "_cartopy_utils")
+)
+def test_lazy_attrs_in_dir_and_accessible(attr):
+
+    assert attr in dir(mpu)
+    assert getattr(mpu, attr) is not None
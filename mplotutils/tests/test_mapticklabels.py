@@ -1,7 +1,15 @@
 import cartopy.crs as ccrs
 import numpy as np
+import pytest
+import shapely
+from matplotlib.transforms import Bbox
 
 import mplotutils as mpu
+from mplotutils._cartopy_utils import (
+    _boundary_platecarree_cached,
+    _determine_intersections,
+    _get_boundary_platecarree,
+)
 
 from . import subplots_context
 
@@ -91,3 +99,279 @@ def test_xticklabels_robinson():
 
 #         assert ax.texts[0].get_text() == "60°E"
 #         assert ax.texts[-1].get_text() == "60°W"
+
+
+def _determine_intersection_reference(polygon, xy1, xy2, axis):
+
+    intersection = polygon.boundary.intersection(shapely.LineString([xy1, xy2]))
+
+    if intersection.is_empty:
+        return np.nan
+
+    return shapely.get_coordinates(intersection)[:, axis].min()
+
+
+@pytest.mark.parametrize("proj", (ccrs.Robinson(), ccrs.Mollweide()))
+def test_determine_intersections_many_ticks(proj):
+
+    with subplots_context(subplot_kw=dict(projection=proj)) as (f, ax):
+        ax.set_global()
+        f.canvas.draw()
+
+        boundary_pc = _get_boundary_platecarree(ax)
+
+        y = np.linspace(-89, 89, 100)
+        start = np.stack([np.full_like(y, -180), y], axis=-1)
+        end = np.stack([np.full_like(y, 180), y], axis=-1)
+
+        result = _determine_intersections(boundary_pc, start, end, axis=0)
+
+        expected = [
+            _determine_intersection_reference(boundary_pc, s, e, axis=0)
+            for s, e in zip(start, end)
+        ]
+
+        np.testing.assert_allclose(result, expected)
+
+
+def test_determine_intersections_no_intersection():
+
+    polygon = shapely.box(0, 0, 1, 1)
+
+    start = np.array([[-1, 0.5], [-1, 2]])
+    end = np.array([[2, 0.5], [2, 2]])
+
+    result = _determine_intersections(polygon, start, end, axis=0)
+    np.testing.assert_equal(result, [0, np.nan])
+
+    empty = np.empty((0, 2))
+    assert _determine_intersections(polygon, empty, empty, axis=0).size == 0
+
+
+def test_boundary_platecarree_cached():
+
+    _boundary_platecarree_cached.cache_clear()
+
+    subplot_kw = dict(projection=ccrs.Robinson())
+    with subplots_context(2, 2, subplot_kw=subplot_kw) as (f, axs):
+        for ax in axs.flat:
+            ax.set_global()
+
+        f.canvas.draw()
+
+        boundaries = [_get_boundary_platecarree(ax) for ax in axs.flat]
+
+        # computed once for all panels
+        info = _boundary_platecarree_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 3
+        assert all(b is boundaries[0] for b in boundaries)
+
+        # changing the extent invalidates the cache
+        axs[0, 0].set_extent((-20, 20, -10, 10), ccrs.PlateCarree())
+        f.canvas.draw()
+
+        boundary = _get_boundary_platecarree(axs[0, 0])
+        assert boundary is not boundaries[0]
+        assert _boundary_platecarree_cached.cache_info().misses == 2
+        np.testing.assert_allclose(boundary.bounds, (-20, -10, 20, 10), atol=0.5)
+
+
+@pytest.mark.parametrize("func", (mpu.xticklabels, mpu.yticklabels))
+def test_ticklabels_no_draw(func):
+
+    subplot_kw = dict(projection=ccrs.Robinson())
+    with subplots_context(subplot_kw=subplot_kw) as (f, ax):
+        ax.set_global()
+
+        events = []
+        f.canvas.mpl_connect("draw_event", events.append)
+
+        func(np.arange(-60, 61, 30), ax=ax)
+
+        assert len(events) == 0
+        assert len(ax.texts) == 5
+
+
+def test_boundary_platecarree_without_draw():
+
+    subplot_kw = dict(projection=ccrs.Robinson())
+    with subplots_context(subplot_kw=subplot_kw) as (f, ax):
+        ax.set_extent((-20, 40, -10, 50), ccrs.PlateCarree())
+
+        # not yet drawn
+        boundary = _get_boundary_platecarree(ax)
+
+        f.canvas.draw()
+        expected = _get_boundary_platecarree(ax)
+
+        assert boundary.equals(expected)
+
+
+def _render(fig):
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba()).copy()
+
+
+@pytest.mark.parametrize("func", (mpu.xticklabels, mpu.yticklabels))
+def test_ticklabels_collection_single_artist(func):
+    with subplots_context(subplot_kw=dict(projection=ccrs.Robinson())) as (f, ax):
+        ax.set_global()
+
+        ticks = np.arange(-180, 181, 30)
+        artist = func(ticks, ax=ax, size=8, collection=True)
+
+        assert isinstance(artist, mpu._cartopy_utils.MapTickLabels)
+        assert len(ax.texts) == 0
+        assert artist in ax.artists
+
+        labels = func(ticks, ax=ax, size=8)
+        assert artist.get_texts() == [label.get_text() for label in labels]
+        np.testing.assert_allclose(artist.xy, [label.xy for label in labels])
+
+
+@pytest.mark.parametrize("func", (mpu.xticklabels, mpu.yticklabels))
+def test_ticklabels_collection_same_as_annotate(func):
+    proj = ccrs.Robinson()
+    ticks = np.arange(-180, 181, 30)
+
+    with subplots_context(subplot_kw=dict(projection=proj)) as (f, ax):
+        ax.set_global()
+        func(ticks, ax=ax, size=8)
+        expected = _render(f)
+
+    with subplots_context(subplot_kw=dict(projection=proj)) as (f, ax):
+        ax.set_global()
+        func(ticks, ax=ax, size=8, collection=True)
+        actual = _render(f)
+
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_ticklabels_collection_window_extent():
+    with subplots_context(subplot_kw=dict(projection=ccrs.Robinson())) as (f, ax):
+        ax.set_global()
+
+        ticks = np.arange(-90, 91, 30)
+        artist = mpu.yticklabels(ticks, ax=ax, size=8, collection=True)
+        labels = mpu.yticklabels(ticks, ax=ax, size=8)
+
+        renderer = f.canvas.get_renderer()
+        expected = Bbox.union([label.get_window_extent(renderer) for label in labels])
+
+        np.testing.assert_allclose(
+            artist.get_window_extent(renderer).bounds, expected.bounds
+        )
+
+
+@pytest.mark.parametrize("func", (mpu.xticklabels, mpu.yticklabels))
+def test_ticklabels_array_of_axes(func):
+    subplot_kw = dict(projection=ccrs.Robinson())
+    with subplots_context(2, 3, subplot_kw=subplot_kw) as (f, axs):
+        for ax in axs.flat:
+            ax.set_global()
+
+        ticks = np.arange(-90, 91, 30)
+        result = func(ticks, ax=axs)
+
+        assert len(result) == axs.size
+        expected = func(ticks, ax=axs[0, 0])
+
+        for ax, labels in zip(axs.flat, result, strict=True):
+            assert [t.get_text() for t in labels] == [t.get_text() for t in expected]
+            assert all(t.axes is ax for t in labels)
+
+
+@pytest.mark.parametrize(
+    "func, labeled",
+    (
+        (mpu.yticklabels, [True, False, False, True, False, False]),
+        (mpu.xticklabels, [False, False, False, True, True, True]),
+    ),
+)
+def test_ticklabels_outer_only(func, labeled):
+    subplot_kw = dict(projection=ccrs.Robinson())
+    with subplots_context(2, 3, subplot_kw=subplot_kw) as (f, axs):
+        for ax in axs.flat:
+            ax.set_global()
+
+        ticks = np.arange(-90, 91, 30)
+        result = func(ticks, ax=axs, outer_only=True, collection=True)
+
+        assert [r is not None for r in result] == labeled
+        assert [len(ax.artists) == 1 for ax in axs.flat] == labeled
+
+
+def test_ticklabels_array_of_axes_boundary_computed_once():
+    _boundary_platecarree_cached.cache_clear()
+
+    subplot_kw = dict(projection=ccrs.Robinson())
+    with subplots_context(2, 2, subplot_kw=subplot_kw) as (f, axs):
+        for ax in axs.flat:
+            ax.set_global()
+
+        mpu.yticklabels([-30, 0, 30], ax=axs)
+
+        info = _boundary_platecarree_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 3
+
+
+@pytest.mark.parametrize("func", (mpu.xticklabels, mpu.yticklabels))
+def test_ticklabels_dynamic_follow_extent(func):
+    proj = ccrs.PlateCarree()
+    ticks = np.arange(-180, 181, 10)
+
+    with subplots_context(subplot_kw=dict(projection=proj)) as (f, ax):
+        ax.set_global()
+        artist = func(ticks, ax=ax, dynamic=True)
+
+        assert isinstance(artist, mpu._cartopy_utils.DynamicMapTickLabels)
+
+        ax.set_extent([-20, 20, -20, 20], proj)
+        f.canvas.draw()
+
+        labels = func(ticks, ax=ax)
+        assert artist.get_texts() == [label.get_text() for label in labels]
+        np.testing.assert_allclose(artist.xy, [label.xy for label in labels])
+
+
+def test_ticklabels_dynamic_recompute_only_on_change(monkeypatch):
+    proj = ccrs.PlateCarree()
+
+    with subplots_context(subplot_kw=dict(projection=proj)) as (f, ax):
+        ax.set_global()
+        artist = mpu.yticklabels([-30, 0, 30], ax=ax, dynamic=True)
+
+        n_calls = 0
+        get_positions = artist.get_positions
+
+        def counting(*args):
+            nonlocal n_calls
+            n_calls += 1
+            return get_positions(*args)
+
+        monkeypatch.setattr(artist, "get_positions", counting)
+
+        f.canvas.draw()
+        f.set_size_inches(4, 3)
+        f.canvas.draw()
+        assert n_calls == 0
+
+        ax.set_extent([-20, 20, -20, 20], proj)
+        f.canvas.draw()
+        f.canvas.draw()
+        assert n_calls == 1
+
+
+def test_ticklabels_dynamic_no_ticks_on_map():
+    proj = ccrs.PlateCarree()
+
+    with subplots_context(subplot_kw=dict(projection=proj)) as (f, ax):
+        ax.set_global()
+        artist = mpu.yticklabels([-30, 30], ax=ax, dynamic=True)
+
+        ax.set_extent([-10, 10, -10, 10], proj)
+        f.canvas.draw()
+
+        assert artist.get_texts() == []
@@ -0,0 +1,48 @@
+import pytest
+
+import mplotutils as mpu
+from mplotutils._options import OPTIONS, _autodraw_from_env
+
+
+def test_set_options_wrong_key():
+
+    with pytest.raises(ValueError, match="'foo' is not in the set of valid options"):
+        mpu.set_options(foo=True)
+
+
+def test_set_options_wrong_value():
+
+    with pytest.raises(ValueError, match="Invalid value for option 'autodraw'"):
+        mpu.set_options(autodraw="none")
+
+
+def test_set_options_context():
+
+    assert OPTIONS["autodraw"] == "all"
+
+    with mpu.set_options(autodraw="never"):
+        assert OPTIONS["autodraw"] == "never"
+
+    assert OPTIONS["autodraw"] == "all"
+
+
+def test_set_options_global():
+
+    try:
+        mpu.set_options(autodraw="never")
+        assert OPTIONS["autodraw"] == "never"
+    finally:
+        mpu.set_options(autodraw="all")
+
+
+def test_autodraw_from_env(monkeypatch):
+
+    monkeypatch.delenv("MPLOTUTILS_AUTODRAW", raising=False)
+    assert _autodraw_from_env() == "all"
+
+    monkeypatch.setenv("MPLOTUTILS_AUTODRAW", "never")
+    assert _autodraw_from_env() == "never"
+
+    monkeypatch.setenv("MPLOTUTILS_AUTODRAW", "wrong")
+    with pytest.warns(UserWarning, match="Invalid value for 'MPLOTUTILS_AUTODRAW'"):
+        assert _autodraw_from_env() == "all"
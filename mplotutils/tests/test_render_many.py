@@ -0,0 +1,66 @@
+import io
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from PIL import Image
+
+import mplotutils as mpu
+
+
+def plot(value):
+
+    f, ax = plt.subplots(figsize=(2, 2))
+    h = ax.pcolormesh([[0, value]], vmin=0, vmax=3)
+    mpu.colorbar(h, ax)
+
+    return f
+
+
+def plot_error(value):
+    raise ValueError(f"error {value}")
+
+
+def _to_array(content):
+    return np.asarray(Image.open(io.BytesIO(content)))
+
+
+def test_render_many_bytes():
+
+    values = [0, 1, 2, 3, 0]
+
+    result = mpu.render_many(plot, values, max_workers=2, dpi=20)
+
+    assert len(result) == len(values)
+    assert all(r.startswith(b"\x89PNG") for r in result)
+
+    # results are in order
+    np.testing.assert_equal(_to_array(result[0]), _to_array(result[-1]))
+    assert not np.array_equal(_to_array(result[0]), _to_array(result[1]))
+
+    # same as rendering in the main process
+    f = plot(1)
+    try:
+        buffer = io.BytesIO()
+        f.savefig(buffer, format="png", dpi=20)
+    finally:
+        plt.close(f)
+
+    np.testing.assert_equal(_to_array(result[1]), _to_array(buffer.getvalue()))
+
+
+def test_render_many_fname(tmp_path):
+
+    fname = str(tmp_path / "map_{:02d}.png")
+
+    result = mpu.render_many(plot, range(3), fname=fname, max_workers=1, dpi=20)
+
+    expected = [str(tmp_path / f"map_{i:02d}.png") for i in range(3)]
+    assert result == expected
+    assert all((tmp_path / f"map_{i:02d}.png").exists() for i in range(3))
+
+
+def test_render_many_error():
+
+    with pytest.raises(ValueError, match="error 1"):
+        mpu.render_many(plot_error, [1], max_workers=1)
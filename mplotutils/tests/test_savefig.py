@@ -1,12 +1,13 @@
 import io
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pytest
 
 import mplotutils as mpu
 from mplotutils.tests.test_colorbar import create_fig_aspect
 
-from . import figure_context
+from . import count_draw_events, figure_context, subplots_context
 
 
 def test_autodraw_orig_func():
@@ -61,7 +62,7 @@ def test_ensure_draw_method_called(monkeypatch):
             f.savefig(io.BytesIO())
 
 
-def test_saved_figure_not_the_same_vertical():
+def test_saved_figure_the_same_vertical():
 
     with figure_context() as f:
         create_fig_aspect(aspect=0.5, orientation="vertical")
@@ -75,10 +76,11 @@ def test_saved_figure_not_the_same_vertical():
         with mpu.autodraw(True):
             f.savefig(file_autodraw)
 
-        assert file_no_autodraw.getvalue() != file_autodraw.getvalue()
+        # the colorbar is positioned within the draw, so autodraw is not required
+        assert file_no_autodraw.getvalue() == file_autodraw.getvalue()
 
 
-def test_saved_figure_not_the_same_horizontal():
+def test_saved_figure_the_same_horizontal():
 
     with figure_context() as f:
         create_fig_aspect(aspect=2, orientation="horizontal")
@@ -93,4 +95,64 @@ def test_saved_figure_not_the_same_horizontal():
         with mpu.autodraw(True):
             f.savefig(file_autodraw)
 
-        assert file_no_autodraw.getvalue() != file_autodraw.getvalue()
+        # the colorbar is positioned within the draw, so autodraw is not required
+        assert file_no_autodraw.getvalue() == file_autodraw.getvalue()
+
+
+@pytest.mark.parametrize(
+    "autodraw, expected_plain, expected_mpu",
+    (("all", 2, 1), ("never", 1, 1)),
+)
+def test_autodraw_option_draws_per_savefig(autodraw, expected_plain, expected_mpu):
+
+    with mpu.autodraw(True), mpu.set_options(autodraw=autodraw):
+
+        with subplots_context() as (f, ax):
+            ax.pcolormesh([[0, 1]])
+            events = count_draw_events(f)
+
+            f.savefig(io.BytesIO())
+            assert len(events) == expected_plain
+
+        with subplots_context() as (f, ax):
+            h = ax.pcolormesh([[0, 1]])
+            mpu.colorbar(h, ax)
+            events = count_draw_events(f)
+
+            f.savefig(io.BytesIO())
+            assert len(events) == expected_mpu
+
+
+def test_colorbar_positioned_in_single_draw():
+
+    with mpu.autodraw(True):
+        with subplots_context() as (f, ax):
+            h = ax.pcolormesh([[0, 1]])
+            cbar = mpu.colorbar(h, ax)
+            events = count_draw_events(f)
+
+            f.savefig(io.BytesIO())
+            assert len(events) == 1
+
+            # changing the parent changes the position of the colorbar
+            ax.set_aspect(0.5)
+            f.savefig(io.BytesIO())
+            assert len(events) == 2
+
+            pos = cbar.ax.get_position()
+            np.testing.assert_allclose(pos.y0, ax.get_position().y0)
+
+
+def test_deferred_colorbar_positioned_in_single_draw():
+
+    with mpu.autodraw(True):
+        with subplots_context() as (f, ax):
+            h = ax.pcolormesh([[0, 1]])
+            cbar = mpu.colorbar(h, ax, defer=True)
+            events = count_draw_events(f)
+
+            f.savefig(io.BytesIO())
+            assert len(events) == 1
+
+            pos = cbar.ax.get_position()
+            np.testing.assert_allclose(pos.y0, ax.get_position().y0)